@@ -1,24 +1,45 @@
 import sys
 import subprocess
 import shutil
+import tempfile
 import re
+import html
 import webbrowser
 import time
 import json
+import copy
+import bisect
+import heapq
+import math
+import codecs
+import pickle
+import mmap
+import struct
+import sqlite3
+import hashlib
+import threading
 import os
 import os.path
 import importlib.util
+import importlib.metadata
 import importlib
 import platform
+from contextlib import closing
+import socket
 import winreg
 import psutil
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QPushButton, QGridLayout, QWidget, 
                             QLabel, QLineEdit, QListWidget, QVBoxLayout, QTextEdit, QInputDialog, 
                             QMessageBox, QListWidgetItem, QDialog, QFormLayout, QComboBox, QCheckBox, 
                             QDialogButtonBox, QHBoxLayout, QFileDialog, QSpacerItem, QSizePolicy, 
-                            QAction, QMenu, QToolBar, QTextBrowser, QToolButton, QColorDialog)
-from PyQt5.QtCore import Qt, QSize, pyqtSignal, QTimer, QEvent
-from PyQt5.QtGui import QTextCharFormat, QFont, QTextCursor, QTextListFormat, QColor, QSyntaxHighlighter
+                            QAction, QMenu, QToolBar, QTextBrowser, QToolButton, QColorDialog, QSpinBox,
+                            QProgressDialog, QRadioButton, QTableView, QHeaderView, QStyledItemDelegate, QStyle)
+from PyQt5.QtCore import Qt, QSize, QRect, pyqtSignal, QTimer, QEvent, QObject, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QTextCharFormat, QFont, QTextCursor, QTextListFormat, QColor, QSyntaxHighlighter, QPainter
 
 class CommandHighlighter(QSyntaxHighlighter):
     def __init__(self, parent, default_commands, custom_commands):
@@ -50,6 +71,10 @@ class CommandHighlighter(QSyntaxHighlighter):
             start, end = match.span()
             self.setFormat(start, end - start, self.placeholder_format)
 
+def get_app_data_dir():
+    """Return the per-user LaunchPad data directory."""
+    return os.path.join(os.getenv('LOCALAPPDATA') or os.path.expanduser("~"), 'LaunchPad')
+
 def install_required_module(module_name):
     """Install a required Python module using pip."""
     print(f"Attempting to install {module_name}...")
@@ -60,41 +85,72 @@ def install_required_module(module_name):
         print(f"Failed to install {module_name}: {e}")
         raise
 
-def verify_module(module_name, import_names, test_attrs):
-    """Verify module installation in a fresh interpreter."""
+def verify_modules(required_modules):
+    """Verify all module installations in a single fresh interpreter."""
+    checks = [(module_name, import_names, test_attrs) for module_name, (pip_name, import_names, test_attrs) in required_modules.items()]
     script = (
         "import importlib\n"
         "importlib.invalidate_caches()\n"
-        "try:\n"
-        f"    {'; '.join(f'module_{i} = importlib.import_module(\"{name}\")' for i, name in enumerate(import_names))}\n"
-        f"    {'; '.join(f'getattr(module_{i}, \"{attr}\")' for i, attr in enumerate(test_attrs))}\n"
-        "    print('SUCCESS')\n"
-        "except (ImportError, AttributeError) as e:\n"
-        "    print('FAIL: ' + str(e))"
+        f"checks = {checks!r}\n"
+        "for module_name, import_names, test_attrs in checks:\n"
+        "    try:\n"
+        "        for import_name, test_attr in zip(import_names, test_attrs):\n"
+        "            getattr(importlib.import_module(import_name), test_attr)\n"
+        "        print('SUCCESS ' + module_name)\n"
+        "    except (ImportError, AttributeError) as e:\n"
+        "        print('FAIL ' + module_name + ': ' + str(e))"
     )
     try:
         result = subprocess.check_output([sys.executable, '-c', script], text=True, stderr=subprocess.STDOUT)
-        if 'SUCCESS' in result:
-            print(f"{module_name} successfully installed and verified.")
-            return True
-        else:
-            print(f"Verification failed: {result.strip()}")
-            return False
     except subprocess.CalledProcessError as e:
-        print(f"Error verifying {module_name}: {e.output}")
+        print(f"Error verifying modules: {e.output}")
         return False
+    all_verified = True
+    for module_name in required_modules:
+        if f"SUCCESS {module_name}" in result.splitlines():
+            print(f"{module_name} successfully installed and verified.")
+        else:
+            all_verified = False
+    for line in result.splitlines():
+        if line.startswith("FAIL "):
+            print(f"Verification failed: {line[5:]}")
+    return all_verified
+
+def get_module_check_stamp(required_modules):
+    """Describe the interpreter and installed distributions the last successful check ran against."""
+    distribution_names = [pip_name for pip_name, import_names, test_attrs in required_modules.values()] + ['PyQt5-sip', 'PyQt5-Qt5']
+    distributions = {}
+    for name in distribution_names:
+        try:
+            distributions[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            distributions[name] = None
+    return {
+        "executable": sys.executable,
+        "python_version": sys.version,
+        "distributions": distributions
+    }
 
 def check_and_install_modules():
     """
     Check for required modules and install if missing or broken.
     Currently checks for: PyQt5 and its dependencies
+    Skipped entirely while the verification stamp matches the current environment.
     """
     required_modules = {
         'PyQt5': ('PyQt5', ['PyQt5.QtWidgets', 'PyQt5.QtCore'], ['QApplication', 'Qt']),
         'pywin32': ('pywin32', ['win32com.client'], ['Dispatch']),
         'psutil': ('psutil', ['psutil'], ['Process'])
     }
-    
+    stamp_file = os.path.join(get_app_data_dir(), "module_check.json")
+    stamp = get_module_check_stamp(required_modules)
+    try:
+        with open(stamp_file, 'r') as f:
+            if json.load(f) == stamp:
+                return
+    except (OSError, ValueError):
+        pass
+
     print("Verifying installations...")
     try:
         for module_name, (pip_name, import_names, test_attrs) in required_modules.items():
@@ -106,10 +162,21 @@ def check_and_install_modules():
                 getattr(module, test_attr)
             print(f"{module_name} is installed and functional.")
         print("All required modules are verified.")
+        try:
+            os.makedirs(os.path.dirname(stamp_file), exist_ok=True)
+            with open(stamp_file, 'w') as f:
+                json.dump(stamp, f, indent=4)
+        except OSError as e:
+            print(f"Failed to write verification stamp: {str(e)}")
         return
     except (ImportError, AttributeError) as e:
         print(f"Module verification failed: {str(e)}")
         print("Attempting repair...")
+        phase_start = time.perf_counter()
+        def end_phase(name):
+            nonlocal phase_start
+            print(f"{name} took {time.perf_counter() - phase_start:.1f}s")
+            phase_start = time.perf_counter()
         try:
             print("Cleaning up old installations...")
             packages_to_remove = ['PyQt5', 'PyQt5-Qt5', 'PyQt5-sip', 'PyQtWebEngine']
@@ -118,15 +185,18 @@ def check_and_install_modules():
                     subprocess.check_call([sys.executable, '-m', 'pip', 'uninstall', '-y', package])
                 except:
                     print(f"Note: {package} was not installed")
+            end_phase("Cleanup")
             print("Purging pip cache...")
             subprocess.check_call([sys.executable, '-m', 'pip', 'cache', 'purge'])
+            end_phase("Cache purge")
             print("Installing required packages...")
             install_required_module('PyQt5-sip')
             install_required_module('PyQt5')
+            end_phase("Installation")
             print("Verifying new installation...")
-            for module_name, (pip_name, import_names, test_attrs) in required_modules.items():
-                if not verify_module(module_name, import_names, test_attrs):
-                    raise Exception(f"Verification of {module_name} failed after installation")
+            if not verify_modules(required_modules):
+                raise Exception("Verification failed after installation")
+            end_phase("Verification")
             print("All required modules successfully installed and verified.")
             print("Starting new process to apply module changes...")
             subprocess.run([sys.executable] + sys.argv)
@@ -139,6 +209,14 @@ def check_and_install_modules():
 
 check_and_install_modules()
 
+def get_default_browser_prog_id():
+    """Return the lowercased ProgId of the user's default http handler, or None."""
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\Shell\Associations\UrlAssociations\http\UserChoice") as key:
+            return winreg.QueryValueEx(key, "ProgId")[0].lower()
+    except Exception:
+        return None
+
 def get_installed_browsers():
     """Detect installed browsers and the default browser."""
     browsers = []
@@ -162,21 +240,18 @@ def get_installed_browsers():
                         browser_paths[name] = full_path
                         break
 
-        try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\Shell\Associations\UrlAssociations\http\UserChoice") as key:
-                prog_id = winreg.QueryValueEx(key, "ProgId")[0].lower()
-                if any(s in prog_id for s in ["chrome", "googlechrome"]):
-                    default_browser = "Chrome"
-                elif any(s in prog_id for s in ["firefox", "mozilla"]):
-                    default_browser = "Firefox"
-                elif any(s in prog_id for s in ["edge", "msedge", "microsoft-edge"]):
-                    default_browser = "Edge"
-                elif "opera" in prog_id:
-                    default_browser = "Opera"
-                elif "safari" in prog_id:
-                    default_browser = "Safari"
-        except Exception:
-            pass
+        prog_id = get_default_browser_prog_id()
+        if prog_id:
+            if any(s in prog_id for s in ["chrome", "googlechrome"]):
+                default_browser = "Chrome"
+            elif any(s in prog_id for s in ["firefox", "mozilla"]):
+                default_browser = "Firefox"
+            elif any(s in prog_id for s in ["edge", "msedge", "microsoft-edge"]):
+                default_browser = "Edge"
+            elif "opera" in prog_id:
+                default_browser = "Opera"
+            elif "safari" in prog_id:
+                default_browser = "Safari"
 
         if not default_browser:
             try:
@@ -216,6 +291,1153 @@ def get_installed_browsers():
     
     return browsers, browser_paths
 
+COMMAND_VOCABULARY_VERSION = 1
+COMMAND_VOCABULARY_TTL = 7 * 24 * 60 * 60  # Re-probe the shells at most once a week
+LINK_USAGE_VERSION = 1
+LINK_USAGE_HALF_LIFE = 7 * 24 * 60 * 60  # A launch counts half as much a week later
+LINK_USAGE_WRITE_DELAY_MS = 5000  # Launches come in bursts; the usage file is written once they settle
+
+def get_shell_fingerprint():
+    """Cheap fingerprint of the installed shells, used to invalidate the command vocabulary cache."""
+    system_root = os.getenv("SystemRoot", r"C:\Windows")
+    fingerprint = {"os": platform.version()}
+    shells = [
+        ("cmd", r"System32\cmd.exe"),
+        ("powershell", r"System32\WindowsPowerShell\v1.0\powershell.exe")
+    ]
+    for name, path in shells:
+        try:
+            stat = os.stat(os.path.join(system_root, path))
+            fingerprint[name] = f"{stat.st_size}:{int(stat.st_mtime)}"
+        except OSError:
+            fingerprint[name] = None
+    return fingerprint
+
+def probe_command_vocabulary():
+    """Discover CMD built-ins and PowerShell cmdlets by running the shells (slow)."""
+    commands = []
+    # Fetch CMD built-ins
+    try:
+        cmd_output = subprocess.check_output("cmd /c help", shell=True, text=True).splitlines()
+        for line in cmd_output:
+            parts = line.strip().split()
+            cmd = parts[0].lower() if parts else ""
+            if cmd and cmd not in commands and len(cmd) > 1:
+                commands.append(cmd)
+    except (subprocess.CalledProcessError, OSError):
+        pass
+    # Fetch PowerShell cmdlets
+    try:
+        ps_output = subprocess.check_output('powershell -Command "Get-Command -CommandType Cmdlet | ForEach-Object { $_.Name }"', shell=True, text=True).splitlines()
+        for cmdlet in ps_output:
+            cmd = cmdlet.strip().lower()
+            if cmd and cmd not in commands:
+                commands.append(cmd)
+    except (subprocess.CalledProcessError, OSError):
+        pass
+    return commands
+
+def load_command_vocabulary(cache_file):
+    """Return (commands, is_fresh) from the on-disk vocabulary cache."""
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return [], False
+    if not isinstance(cache, dict) or cache.get("version") != COMMAND_VOCABULARY_VERSION:
+        return [], False
+    commands = cache.get("commands", [])
+    is_fresh = (
+        time.time() - cache.get("created", 0) < COMMAND_VOCABULARY_TTL
+        and cache.get("shells") == get_shell_fingerprint()
+    )
+    return commands, is_fresh
+
+def save_command_vocabulary(cache_file, commands):
+    """Persist the probed vocabulary together with the shell fingerprint it was taken from."""
+    cache = {
+        "version": COMMAND_VOCABULARY_VERSION,
+        "created": time.time(),
+        "shells": get_shell_fingerprint(),
+        "commands": commands
+    }
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"Failed to save command vocabulary: {str(e)}")
+
+def load_link_usage(usage_file):
+    """Return {link settings key: [frecency, last launched]} from the usage file, or {} if there is none."""
+    try:
+        with open(usage_file, 'r') as f:
+            usage = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(usage, dict) or usage.get("version") != LINK_USAGE_VERSION:
+        return {}
+    return usage.get("links", {})
+
+def record_link_launch(usage, key, now):
+    """
+    Count a launch of the link with settings key at time now.
+    Frecency is log2 of the decayed launch count plus now in half-lives: it never has to be re-decayed,
+    and comparing two links' frecency compares their decayed counts at any common time.
+    """
+    frecency = now / LINK_USAGE_HALF_LIFE
+    if key in usage:
+        frecency += math.log2(1 + 2 ** (usage[key][0] - frecency))
+    usage[key] = [frecency, now]
+
+def content_digest(data):
+    """Stable hash of a JSON-serialisable value, used to tell whether a store changed since it was saved."""
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+
+def write_text_atomic(path, text, mode='w'):
+    """Write text (or bytes with mode='wb') to a temp file beside path, then atomically rename it over path."""
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, mode) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+def iter_json_array(path, chunk_size=1 << 16):
+    """Yield (record, bytes read so far) for each element of a top-level JSON array, reading the file in chunks."""
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer, pos, bytes_read, eof = "", 0, 0, False
+    # What may come next: "[" to open, a value or "]" first, "," or "]" after a value, a value after a comma, nothing after "]"
+    expecting = "open"
+    with open(path, 'rb') as f:
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos < len(buffer):
+                char = buffer[pos]
+                if expecting == "open":
+                    if char != "[":
+                        raise ValueError("Expected a JSON array of records")
+                    expecting, pos = "first", pos + 1
+                    continue
+                if expecting == "end":
+                    raise json.JSONDecodeError("Extra data after the JSON array", buffer, pos)
+                if expecting == "separator":
+                    if char not in ",]":
+                        raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+                    expecting, pos = "value" if char == "," else "end", pos + 1
+                    continue
+                if char == "]" and expecting == "first":
+                    expecting, pos = "end", pos + 1
+                    continue
+                if char in ",]":
+                    raise json.JSONDecodeError("Expecting value", buffer, pos)
+                try:
+                    record, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                else:
+                    # A value ending exactly at the buffer end may continue in the next chunk
+                    if end < len(buffer) or eof:
+                        pos, expecting = end, "separator"
+                        yield record, bytes_read
+                        continue
+            elif eof:
+                if expecting == "end":
+                    return
+                raise json.JSONDecodeError("Unexpected end of file: the JSON array is not closed", buffer, pos)
+            chunk = f.read(chunk_size)
+            bytes_read += len(chunk)
+            eof = not chunk
+            buffer = buffer[pos:] + text_decoder.decode(chunk, final=eof)
+            pos = 0
+
+def iter_json_records(path):
+    """Yield (record, bytes read so far, schema version) from a plain JSON array, streamed, or a {"records": [...]} store file, read whole."""
+    with open(path, 'rb') as f:
+        head = f.read(4096).decode('utf-8-sig', 'ignore').lstrip()
+    if not head.startswith("{"):
+        for record, bytes_read in iter_json_array(path):
+            yield record, bytes_read, 1  # Exports and older store files carry no version
+        return
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        data = json.load(f)
+    if not isinstance(data.get("records"), list):
+        raise ValueError("Expected a JSON array of records or an object with a \"records\" array")
+    size = os.path.getsize(path)
+    for record in data["records"]:
+        yield record, size, data.get("schema_version", 1)
+
+def normalize_command(command):
+    """Bring a command record from an older file or export up to the current fields."""
+    if "pause_between_commands" not in command:
+        command["pause_between_commands"] = False
+    if "pause_at_end" in command:
+        command["pause_between_commands"] = command.pop("pause_at_end")
+    return command
+
+def normalize_guide(guide):
+    """Bring a guide record from an older file or export up to the current HTML fields."""
+    if isinstance(guide["steps"], list):
+        guide["steps"] = '<ol style="font-size: 16px;">' + "".join(f"<li>{step}</li>" for step in guide["steps"]) + "</ol>"
+    if not guide["description"].startswith("<"):
+        guide["description"] = f'<p style="font-size: 16px;">{guide["description"]}</p>'
+    return guide
+
+IMPORT_SELECTION_LIMIT = 1000  # Larger imports skip the per-record selection dialog
+
+def find_duplicate_titles(existing, imported):
+    """Titles of imported records that collide with an existing record or an earlier imported one."""
+    titles = {record.get("title") for record in existing}
+    duplicates = []
+    for record in imported:
+        if record["title"] in titles:
+            duplicates.append(record["title"])
+        else:
+            titles.add(record["title"])
+    return duplicates
+
+def merge_imported_records(existing, imported, strategy, search_indexes=()):
+    """
+    Add imported records to existing in place; duplicates are skipped, overwritten or renamed. Returns (added, replaced, skipped).
+    search_indexes are kept in step with existing record by record.
+    """
+    index = {}
+    for i, record in enumerate(existing):
+        index.setdefault(record.get("title"), i)
+    added = replaced = skipped = 0
+    for record in imported:
+        title = record["title"]
+        if title in index and strategy == "overwrite":
+            for search_index in search_indexes:
+                search_index.replace(existing[index[title]], record)
+            existing[index[title]] = record
+            replaced += 1
+            continue
+        if title in index and strategy == "rename":
+            number = 2
+            while f"{title} ({number})" in index:
+                number += 1
+            title = record["title"] = f"{title} ({number})"
+        if title in index:
+            skipped += 1
+            continue
+        index[title] = len(existing)
+        existing.append(record)
+        for search_index in search_indexes:
+            search_index.add(record)
+        added += 1
+    return added, replaced, skipped
+
+STORE_MIRROR_VERSION = 2  # 2: records are stored at the current schema version
+
+# Startup snapshot: fixed header (magic, format version, payload length) followed by a pickled payload
+SNAPSHOT_MAGIC = b"LPSNAP"
+SNAPSHOT_VERSION = 4
+SNAPSHOT_HEADER = struct.Struct("<6sHQ")
+
+def load_startup_snapshot(snapshot_file):
+    """Memory-map the snapshot and unpickle its payload; None if it is missing, truncated or from another format version."""
+    try:
+        with open(snapshot_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            magic, version, length = SNAPSHOT_HEADER.unpack_from(mapped)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION or SNAPSHOT_HEADER.size + length != len(mapped):
+                return None
+            with memoryview(mapped)[SNAPSHOT_HEADER.size:] as payload:
+                return pickle.loads(payload)
+    except (OSError, ValueError, struct.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+def save_startup_snapshot(snapshot_file, snapshot):
+    payload = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+    write_text_atomic(snapshot_file, SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(payload)) + payload, 'wb')
+
+LOCAL_LINK_EXTENSIONS = ('.exe', '.txt', '.pdf', '.docx', '.xlsx', '.xlsm', '.bat', '.dotx', '.py')
+
+def is_local_link(url):
+    """True if a link opens a local file or program instead of a website."""
+    url_normalized = os.path.normpath(url.strip()).lower()
+    is_url = url_normalized.startswith(("http://", "https://"))
+    url_basename = os.path.basename(url_normalized)
+    return not is_url and (any(url_basename.endswith(ext) for ext in LOCAL_LINK_EXTENSIONS) or any(url_normalized.endswith(ext) for ext in LOCAL_LINK_EXTENSIONS))
+
+def tokenize(text):
+    """Lowercase word tokens of text, as used by the search indexes."""
+    return re.findall(r"\w+", text.lower())
+
+def literal_terms(query):
+    """Lowercased query terms with punctuation, like "/k" or "-a", which tokenizing would reduce to bare letters."""
+    return [term for term in query.lower().split() if tokenize(term) != [term]]
+
+def trigrams(token):
+    """Character trigrams of a token, padded so the first and last letters count."""
+    padded = f"${token}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+FUZZY_MIN_SIMILARITY = 0.3  # Trigram (Jaccard) similarity a word needs to count as a typo of a query token
+LINK_FIELD_WEIGHTS = {"name": 3.0, "tooltip": 1.5, "url": 1.0}
+FAVORITE_BOOST = 1.5
+COMMAND_FIELD_WEIGHTS = {"title": 3.0, "steps": 1.0}
+GUIDE_FIELD_WEIGHTS = {"title": 3.0, "description": 1.5, "steps": 1.0}
+PALETTE_FIELD_WEIGHTS = {"title": 3.0, "body": 1.0}
+PALETTE_MAX_RESULTS = 50
+
+def command_search_fields(command):
+    """Searchable text of a command: its title and the contents of all its steps."""
+    return {"title": command["title"], "steps": " ".join(step["content"] for step in command["steps"])}
+
+def highlight_matches(text, tokens):
+    """HTML-escape text, highlighting each word that starts with one of the query tokens."""
+    parts, last = [], 0
+    for match in re.finditer(r"\w+", text):
+        if any(match.group().lower().startswith(token) for token in tokens):
+            parts.append(html.escape(text[last:match.start()]))
+            parts.append(f"<span style='background-color: #806600; color: #fff;'>{html.escape(match.group())}</span>")
+            last = match.end()
+    parts.append(html.escape(text[last:]))
+    return "".join(parts)
+
+def html_to_text(markup):
+    """Visible text of a guide's rich-text HTML: no head or style blocks, tags or entities, whitespace collapsed."""
+    markup = re.sub(r"<(head|style|script)\b.*?</\1>", " ", markup, flags=re.IGNORECASE | re.DOTALL)
+    text = html.unescape(re.sub(r"<[^>]+>", " ", markup))
+    return " ".join(text.split())
+
+def guide_search_fields(guide):
+    """Searchable plain text of a guide, extracted once per guide when it enters the index."""
+    return {"title": guide["title"], "description": html_to_text(guide["description"]), "steps": html_to_text(guide["steps"])}
+
+def match_snippet(text, tokens, width=80):
+    """An excerpt of text around its first word that starts with one of the query tokens, or "" if none does."""
+    for match in re.finditer(r"\w+", text):
+        if any(match.group().lower().startswith(token) for token in tokens):
+            start = max(0, match.start() - width // 2)
+            end = min(len(text), match.end() + width // 2)
+            return ("..." if start else "") + text[start:end] + ("..." if end < len(text) else "")
+    return ""
+
+def palette_kind(record):
+    """Store a quick-launch record belongs to: links have a url, commands a list of steps, guides HTML steps."""
+    if "url" in record:
+        return "links"
+    return "commands" if isinstance(record.get("steps"), list) else "guides"
+
+def palette_search_fields(record):
+    """Searchable text of a link, command or guide for the quick-launch palette: its name and everything else."""
+    kind = palette_kind(record)
+    if kind == "links":
+        return {"title": record["name"], "body": f"{record['tooltip']} {record['url']}"}
+    if kind == "commands":
+        return {"title": record["title"], "body": command_search_fields(record)["steps"]}
+    fields = guide_search_fields(record)
+    return {"title": fields["title"], "body": f"{fields['description']} {fields['steps']}"}
+
+def link_search_fields(link):
+    """Searchable text of a link, by field."""
+    return {"name": link.get("name", ""), "url": link.get("url", ""), "tooltip": link.get("tooltip", "")}
+
+class SearchIndex:
+    # Inverted token index over a list of records, kept up to date record by record.
+    # Prefix queries walk a sorted vocabulary, so a query costs the matching tokens, not the record count.
+    def __init__(self, extract_fields):
+        self.extract_fields = extract_fields  # Module-level function, so the index can be pickled into the snapshot
+        self.documents = {}  # Sequence number -> record; numbers follow insertion order
+        self.document_fields = {}  # Sequence number -> {field: extracted text}, so callers can reuse the extraction
+        self.document_tokens = {}  # Sequence number -> {token: frozenset of fields it occurs in}
+        self.postings = {}  # Token -> {sequence number: frozenset of fields}
+        self.vocabulary = []  # Sorted tokens, for prefix lookups
+        self.trigram_tokens = {}  # Trigram -> set of vocabulary tokens containing it, for typo-tolerant lookups
+        self.next_sequence = 0
+        self.sequences = {}  # id(record) -> sequence number
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["sequences"]  # Object ids do not survive pickling
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.sequences = {id(record): sequence for sequence, record in self.documents.items()}
+
+    def rebuild(self, records):
+        self.documents, self.document_fields, self.document_tokens, self.postings, self.trigram_tokens = {}, {}, {}, {}, {}
+        self.next_sequence, self.sequences = 0, {}
+        self.vocabulary = None  # Sorted once at the end instead of an insort per new token
+        for record in records:
+            self.add(record)
+        self.vocabulary = sorted(self.postings)
+
+    def add(self, record, sequence=None):
+        if sequence is None:
+            sequence = self.next_sequence
+            self.next_sequence += 1
+        self.documents[sequence] = record
+        self.sequences[id(record)] = sequence
+        tokens = {}
+        self.document_fields[sequence] = self.extract_fields(record)
+        for field, text in self.document_fields[sequence].items():
+            for token in tokenize(text):
+                tokens.setdefault(token, set()).add(field)
+        tokens = {token: frozenset(fields) for token, fields in tokens.items()}  # Hashable, so ranking can cache a weight per field set
+        self.document_tokens[sequence] = tokens
+        for token, fields in tokens.items():
+            if token not in self.postings:
+                self.postings[token] = {}
+                if self.vocabulary is not None:
+                    bisect.insort(self.vocabulary, token)
+                for trigram in trigrams(token):
+                    self.trigram_tokens.setdefault(trigram, set()).add(token)
+            self.postings[token][sequence] = fields
+
+    def remove(self, record):
+        sequence = self.sequences.pop(id(record), None)
+        if sequence is None:
+            return None
+        del self.documents[sequence]
+        del self.document_fields[sequence]
+        for token in self.document_tokens.pop(sequence):
+            postings = self.postings[token]
+            del postings[sequence]
+            if not postings:
+                del self.postings[token]
+                del self.vocabulary[bisect.bisect_left(self.vocabulary, token)]
+                for trigram in trigrams(token):
+                    self.trigram_tokens[trigram].discard(token)
+                    if not self.trigram_tokens[trigram]:
+                        del self.trigram_tokens[trigram]
+        return sequence
+
+    def replace(self, old_record, new_record):
+        # The new record takes over the old one's place in the ordering
+        self.add(new_record, self.remove(old_record))
+
+    def fields_of(self, record):
+        """The extracted fields of an indexed record."""
+        return self.document_fields[self.sequences[id(record)]]
+
+    def prefix_matches(self, prefix):
+        """Sequence numbers of records with a token starting with prefix."""
+        matches = set()
+        for i in range(bisect.bisect_left(self.vocabulary, prefix), len(self.vocabulary)):
+            token = self.vocabulary[i]
+            if not token.startswith(prefix):
+                break
+            matches.update(self.postings[token])
+        return matches
+
+    def search(self, query, substring=False):
+        """
+        Records matching every query token as a prefix, in insertion order; None if the query has nothing to match on.
+        With substring, tokens also match inside longer words and punctuated terms must appear literally, as in ranked_search.
+        """
+        tokens = set(tokenize(query))
+        literals = literal_terms(query) if substring else []
+        if not tokens and not literals:
+            return None
+        result = None
+        # Longer tokens tend to match fewer records, so the intersection shrinks fastest starting with them
+        for token in sorted(tokens, key=len, reverse=True):
+            if substring:
+                matches = set()
+                for candidate in self.similar_tokens(token, fuzzy=False, substring=True):
+                    matches.update(self.postings[candidate])
+            else:
+                matches = self.prefix_matches(token)
+            result = matches if result is None else result & matches
+            if not result:
+                return []
+        if result is None:
+            result = set(self.documents)  # Only punctuation was typed
+        if literals:
+            result = {sequence for sequence in result if self.contains_literals(sequence, literals)}
+        return [self.documents[sequence] for sequence in sorted(result)]
+
+    def contains_literals(self, sequence, literals):
+        """Whether every literal occurs in one of the record's fields, ignoring case."""
+        return all(any(literal in text.lower() for text in self.document_fields[sequence].values()) for literal in literals)
+
+    def similar_tokens(self, token, fuzzy=True, substring=False):
+        """
+        Vocabulary tokens that token could stand for, with a similarity from 0 to 1; without fuzzy, only prefix matches.
+        With substring, words containing token elsewhere count too, so "dns" still finds "flushdns".
+        """
+        similar = {}
+        for i in range(bisect.bisect_left(self.vocabulary, token), len(self.vocabulary)):
+            candidate = self.vocabulary[i]
+            if not candidate.startswith(token):
+                break
+            similar[candidate] = 1.0 if candidate == token else 0.9
+        if len(token) < 3:
+            return similar  # Too short for trigrams to tell a typo from a different word
+        if substring:
+            # A word containing token contains each of its unpadded trigrams, so only their common words are checked
+            inner = sorted((self.trigram_tokens.get(token[i:i + 3], set()) for i in range(len(token) - 2)), key=len)
+            for candidate in inner[0].intersection(*inner[1:]):
+                if candidate not in similar and token in candidate:
+                    similar[candidate] = 0.6
+        if not fuzzy:
+            return similar
+        query_trigrams = trigrams(token)
+        shared = {}
+        for trigram in query_trigrams:
+            for candidate in self.trigram_tokens.get(trigram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        for candidate, count in shared.items():
+            if candidate in similar:
+                continue
+            similarity = count / (len(query_trigrams) + len(candidate) - count)  # A padded token has len(token) trigrams
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                similar[candidate] = 0.8 * similarity
+        return similar
+
+    def ranked_search(self, query, field_weights, boost=None, fuzzy=True, limit=None, substring=False):
+        """
+        Records that match every query token, exactly, by prefix or (if fuzzy) as a likely typo, best first.
+        A token scores its similarity times the weight of the best field it hit; boost(record) is added on top.
+        With substring, tokens also match inside longer words, and query terms with punctuation such as "/k"
+        must appear literally in one of the fields. Only the best limit records are returned if a limit is
+        given. Returns None if the query has nothing to match on.
+        """
+        tokens = set(tokenize(query))
+        literals = literal_terms(query) if substring else []
+        if not tokens and not literals:
+            return None
+        # Rarest token first, so later tokens only have to score the records still in the running
+        expansions = []
+        for token in tokens:
+            similar = self.similar_tokens(token, fuzzy, substring)
+            expansions.append((sum(len(self.postings[candidate]) for candidate in similar), token, similar))
+        expansions.sort()
+        scores = None
+        weights = {}  # Field set -> weight of its best field
+        for posting_count, token, similar in expansions:
+            token_scores = {}
+            if scores is not None and len(scores) < posting_count:
+                # Fewer records left than postings to walk: look the candidates up in each record's own tokens
+                candidate_fields = ((sequence, candidate, fields) for sequence in scores for candidate, fields in self.document_tokens[sequence].items() if candidate in similar)
+            else:
+                candidate_fields = ((sequence, candidate, fields) for candidate in similar for sequence, fields in self.postings[candidate].items())
+            for sequence, candidate, fields in candidate_fields:
+                weight = weights.get(fields)
+                if weight is None:
+                    weight = weights[fields] = max(field_weights.get(field, 1.0) for field in fields)
+                score = similar[candidate] * weight
+                if score > token_scores.get(sequence, 0):
+                    token_scores[sequence] = score
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {sequence: score + scores[sequence] for sequence, score in token_scores.items() if sequence in scores}
+            if not scores:
+                return []
+        if scores is None:
+            scores = dict.fromkeys(self.documents, 0.0)  # Only punctuation was typed; the literal check below does all the filtering
+        if literals:
+            # Tokenizing drops punctuation, so "/k" alone would match every word starting with "k"
+            scores = {sequence: score for sequence, score in scores.items() if self.contains_literals(sequence, literals)}
+        if boost:
+            for sequence in scores:
+                scores[sequence] += boost(self.documents[sequence])
+        order = lambda sequence: (-scores[sequence], sequence)
+        best = sorted(scores, key=order) if limit is None else heapq.nsmallest(limit, scores, key=order)
+        return [self.documents[sequence] for sequence in best]
+
+def load_store_mirror(mirror_file, source):
+    """Return (records, signature, saved) from the local mirror of a shared store, or (None, None, None) if there is no usable copy."""
+    try:
+        with open(mirror_file, 'r') as f:
+            mirror = json.load(f)
+    except (OSError, ValueError):
+        return None, None, None
+    if not isinstance(mirror, dict) or mirror.get("version") != STORE_MIRROR_VERSION or mirror.get("source") != source:
+        return None, None, None
+    signature = mirror.get("signature")
+    if isinstance(signature, list):
+        signature = tuple(signature)  # JSON has no tuples; file signatures are compared as tuples
+    return mirror.get("records"), signature, mirror.get("saved", 0)
+
+def save_store_mirror(mirror_file, source, signature, records):
+    """Keep a local copy of a shared store together with the signature of the share copy it came from."""
+    mirror = {
+        "version": STORE_MIRROR_VERSION,
+        "source": source,
+        "saved": time.time(),
+        "signature": signature,
+        "records": records
+    }
+    try:
+        os.makedirs(os.path.dirname(mirror_file), exist_ok=True)
+        write_text_atomic(mirror_file, json.dumps(mirror, separators=(",", ":")))
+    except OSError as e:
+        print(f"Failed to save local copy of {os.path.basename(mirror_file)}: {str(e)}")
+
+class CoalescedWriter(QObject):
+    # Collapses a burst of schedule() calls into a single write once things have been quiet for delay_ms
+    def __init__(self, write, delay_ms=500, parent=None):
+        super().__init__(parent)
+        self.write = write
+        self.pending = False
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.flush)
+
+    def schedule(self):
+        self.pending = True
+        self.timer.start()  # Restarts the quiet period
+
+    def flush(self):
+        if self.cancel():
+            self.write()
+
+    def cancel(self):
+        """Drop the scheduled write; returns whether one was pending."""
+        self.timer.stop()
+        pending, self.pending = self.pending, False
+        return pending
+
+class LockTimeoutError(Exception):
+    def __init__(self, filename):
+        super().__init__(f"Timed out waiting for the lock on {filename}")
+        self.filename = filename
+
+class FileLockManager:
+    # Cross-process locks: an exclusively created <file>.lock, held open with an OS advisory lock.
+    # acquire() blocks with exponential backoff, so it must only be called off the GUI thread.
+    # The lock records its owner (host, pid, process start time) plus a heartbeat refreshed while
+    # it is held, so locks left behind by a crashed instance can be reclaimed. Other hosts' clocks
+    # may be off, so a heartbeat is never compared with our time, only watched for changes.
+    LOCK_REGION_OFFSET = 1 << 30  # Lock a byte past the end so the owner info stays readable
+    HEARTBEAT_INTERVAL = 5
+    STALE_AFTER = 60  # Seconds we must see a heartbeat unchanged before a lock is considered abandoned
+
+    def __init__(self, timeout=10.0, initial_delay=0.05, max_delay=1.0):
+        self.timeout = timeout
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.held = {}  # lock file -> open descriptor
+        self.observed_heartbeats = {}  # lock file -> (heartbeat, time.monotonic() when that value was first seen)
+        self.mutex = threading.Lock()
+        self.heartbeat_thread = None
+        self.host = socket.gethostname()
+        self.pid = os.getpid()
+        self.started = psutil.Process(self.pid).create_time()
+
+    def acquire(self, filename, timeout=None):
+        lock_file = f"{filename}.lock"
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        delay = self.initial_delay
+        while not self.try_acquire(lock_file):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.max_delay)
+        return True
+
+    def try_acquire(self, lock_file):
+        try:
+            fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_RDWR)
+        except FileExistsError:
+            if not self.reclaim_if_stale(lock_file):
+                return False
+            try:
+                fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_RDWR)
+            except OSError:
+                return False
+        except OSError:
+            return False
+        try:
+            self.lock_descriptor(fd)
+            self.write_owner(fd)
+        except OSError:
+            os.close(fd)
+            try:
+                os.remove(lock_file)
+            except OSError:
+                pass
+            return False
+        with self.mutex:
+            self.held[lock_file] = fd
+            self.observed_heartbeats.pop(lock_file, None)
+            if self.heartbeat_thread is None:
+                self.heartbeat_thread = threading.Thread(target=self.heartbeat_loop, daemon=True)
+                self.heartbeat_thread.start()
+        return True
+
+    def write_owner(self, fd):
+        owner = {"host": self.host, "pid": self.pid, "started": self.started, "heartbeat": time.time()}
+        data = json.dumps(owner).encode()
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        os.write(fd, data)
+
+    def heartbeat_loop(self):
+        while True:
+            time.sleep(self.HEARTBEAT_INTERVAL)
+            with self.mutex:
+                for lock_file, fd in list(self.held.items()):
+                    try:
+                        self.write_owner(fd)
+                    except OSError as e:
+                        print(f"Failed to refresh heartbeat for {lock_file}: {str(e)}")
+
+    def read_owner(self, lock_file):
+        """Return the owner record of a lock file; legacy PID-only locks fall back to the file's mtime."""
+        with open(lock_file, 'r') as f:
+            content = f.read().strip()
+        try:
+            owner = json.loads(content)
+            if isinstance(owner, dict):
+                return owner
+        except ValueError:
+            pass
+        owner = {"heartbeat": os.path.getmtime(lock_file)}
+        if content.isdigit():
+            owner["pid"] = int(content)
+        return owner
+
+    def stale_reason(self, lock_file, owner):
+        # A live owner rewrites its heartbeat every HEARTBEAT_INTERVAL, so a value that stays the same for
+        # STALE_AFTER by our own monotonic clock means the owner is gone, whatever its host's clock says
+        now = time.monotonic()
+        heartbeat, first_seen = self.observed_heartbeats.get(lock_file, (None, now))
+        if heartbeat != owner.get("heartbeat"):
+            self.observed_heartbeats[lock_file] = (owner.get("heartbeat"), now)
+        elif now - first_seen > self.STALE_AFTER:
+            return f"heartbeat unchanged for {int(now - first_seen)}s"
+        # Liveness can only be checked for processes on this machine
+        if owner.get("host") == self.host and "pid" in owner:
+            try:
+                process = psutil.Process(owner["pid"])
+                if "started" in owner and abs(process.create_time() - owner["started"]) > 1:
+                    return f"pid {owner['pid']} now belongs to another process"
+            except psutil.NoSuchProcess:
+                return f"pid {owner['pid']} is no longer running"
+            except psutil.Error:
+                pass
+        return None
+
+    def reclaim_if_stale(self, lock_file):
+        try:
+            owner = self.read_owner(lock_file)
+        except OSError:
+            return False  # Lock vanished or is unreadable; the caller simply retries
+        reason = self.stale_reason(lock_file, owner)
+        if not reason:
+            return False
+        try:
+            # Re-read just before removing so a lock another instance reclaimed meanwhile is left alone
+            if self.read_owner(lock_file) != owner:
+                return False
+            os.remove(lock_file)
+        except OSError:
+            return False  # Still held open by a live owner (Windows refuses to delete it)
+        self.observed_heartbeats.pop(lock_file, None)
+        print(f"Reclaimed stale lock {lock_file} (host {owner.get('host', 'unknown')}, pid {owner.get('pid', 'unknown')}): {reason}")
+        return True
+
+    def release(self, filename):
+        lock_file = f"{filename}.lock"
+        with self.mutex:
+            fd = self.held.pop(lock_file, None)
+        if fd is None:
+            return
+        try:
+            self.unlock_descriptor(fd)
+        except OSError:
+            pass
+        os.close(fd)  # Windows cannot delete a file that is still open
+        try:
+            os.remove(lock_file)
+        except OSError:
+            pass
+
+    def lock_descriptor(self, fd):
+        if os.name == "nt":
+            os.lseek(fd, self.LOCK_REGION_OFFSET, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            os.lseek(fd, 0, os.SEEK_SET)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def unlock_descriptor(self, fd):
+        if os.name == "nt":
+            os.lseek(fd, self.LOCK_REGION_OFFSET, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+def file_signature(path):
+    """Cheap change signature for a file: (mtime in ns, size), or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+STORE_FILENAMES = {"commands": "commands.json", "links": "launchpad_links.json", "guides": "howto_guides.json"}
+STORE_KEYS = {"commands": "title", "links": "name", "guides": "title"}
+STORE_POLL_INTERVAL_MS = 5000  # How often Shared mode checks the shared files for other users' edits
+
+SCHEMA_VERSION = 2  # Files written before schema versions existed are version 1
+
+def migrate_commands_v1(commands, context):
+    for command in commands:
+        normalize_command(command)
+
+def migrate_links_v1(links, context):
+    # Colors and favorites moved to each user's preferences; the caller files them under its own mode
+    link_settings = context.setdefault("link_settings", {})
+    for link in links:
+        if "color" in link or "favorite" in link:
+            link_settings[link["name"]] = {"color": link.pop("color", "#0078d4"), "favorite": link.pop("favorite", False)}
+
+def migrate_guides_v1(guides, context):
+    for guide in guides:
+        normalize_guide(guide)
+
+def migrate_user_preferences_v1(preferences, context):
+    # Browser choices used to live in link_browser_choices.json
+    link_settings = preferences.setdefault("link_settings", {})
+    for link_key, browser in context.get("browser_choices", {}).items():
+        if link_key in link_settings:
+            link_settings[link_key]["browser"] = browser
+        else:
+            link_settings[link_key] = {"color": "#0078d4", "favorite": False, "browser": browser}
+    preferences.setdefault("powershell_help_updated", False)
+
+# Store -> {version: migration to version + 1}; each runs once, when a file older than SCHEMA_VERSION is read
+SCHEMA_MIGRATIONS = {
+    "commands": {1: migrate_commands_v1},
+    "links": {1: migrate_links_v1},
+    "guides": {1: migrate_guides_v1},
+    "user_preferences": {1: migrate_user_preferences_v1}
+}
+
+def upgrade_schema(store, data, version, context=None):
+    """Run the registered migrations for store from version up to SCHEMA_VERSION, in place; returns data."""
+    context = {} if context is None else context
+    for from_version in range(version, SCHEMA_VERSION):
+        migration = SCHEMA_MIGRATIONS[store].get(from_version)
+        if migration:
+            migration(data, context)
+    return data
+
+def record_keys(store, records):
+    """Identity key of each record; duplicate names/titles are legal in the JSON files, so later duplicates get a numbered key."""
+    key_field = STORE_KEYS[store]
+    seen = {}
+    keys = []
+    for record in records:
+        # "#" is doubled in the name, so the single "#" before a duplicate's number can never match a real name
+        key = str(record.get(key_field, "")).replace("#", "##")
+        seen[key] = seen.get(key, 0) + 1
+        keys.append(key if seen[key] == 1 else f"{key}#{seen[key]}")
+    return keys
+
+def merge_records(store, base, local, remote):
+    """
+    Three-way merge of a store keyed on name/title. base is what we last read or wrote, local is
+    our copy and remote is what is on disk now. Returns (merged, conflicts); a record changed on
+    both sides keeps the local version, unless we deleted it, in which case the other edit is kept.
+    """
+    base_map = dict(zip(record_keys(store, base), base))
+    local_map = dict(zip(record_keys(store, local), local))
+    remote_keys = record_keys(store, remote)
+    remote_map = dict(zip(remote_keys, remote))
+    merged, conflicts = [], []
+    # Remote order first so other users' records keep their place; our new records go at the end
+    for key in remote_keys + [key for key in local_map if key not in remote_map]:
+        base_record, local_record, remote_record = base_map.get(key), local_map.get(key), remote_map.get(key)
+        if local_record == remote_record or local_record == base_record:
+            record = remote_record
+        elif remote_record == base_record:
+            record = local_record
+        else:
+            conflicts.append(key)
+            record = local_record if local_record is not None else remote_record
+        if record is not None:
+            merged.append(record)
+    return merged, conflicts
+
+class JsonStorageBackend:
+    # One JSON document per store; writes replace the whole file and need the cross-process file lock
+    name = "JSON"
+    uses_file_lock = True
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def location(self, store):
+        return os.path.join(self.directory, STORE_FILENAMES[store])
+
+    def exists(self, store):
+        return os.path.exists(self.location(store))
+
+    def version_location(self, store):
+        # The schema version lives beside the file so the file itself stays the plain array older clients read
+        return self.location(store) + ".schema"
+
+    def read(self, store):
+        """Return (records, schema_version)."""
+        with open(self.location(store), 'rb') as f:
+            raw = f.read()
+        data = json.loads(raw)
+        if isinstance(data, dict) and isinstance(data.get("records"), list):
+            return data["records"], data.get("schema_version", 1)  # Envelope written by earlier builds
+        if not isinstance(data, list):
+            raise ValueError("Expected a JSON array of records")
+        return data, self.recorded_version(store, raw)
+
+    def recorded_version(self, store, raw):
+        # The sidecar only counts for the exact bytes it was written with; a file rewritten by an older client is version 1 again
+        try:
+            with open(self.version_location(store), 'r') as f:
+                recorded = json.load(f)
+        except (OSError, ValueError):
+            return 1
+        if not isinstance(recorded, dict) or recorded.get("sha1") != hashlib.sha1(raw).hexdigest():
+            return 1
+        return recorded.get("schema_version", 1)
+
+    def write(self, store, records):
+        # Written as bytes so the hash matches what is read back, newline translation included
+        raw = json.dumps(records, indent=4).encode('utf-8')
+        write_text_atomic(self.location(store), raw, 'wb')
+        write_text_atomic(self.version_location(store), json.dumps({"schema_version": SCHEMA_VERSION, "sha1": hashlib.sha1(raw).hexdigest()}))
+
+    def update(self, store, merge):
+        """Write merge(signature, read) over the store and return the new signature; the caller holds the store's file lock."""
+        self.write(store, merge(self.signature(store), lambda: self.read(store)))
+        return self.signature(store)
+
+    def signature(self, store):
+        return file_signature(self.location(store))
+
+class SqliteStorageBackend:
+    # All stores in one database, one row per record; writes only touch the rows that changed
+    name = "SQLite"
+    uses_file_lock = False  # Saves run in one BEGIN IMMEDIATE transaction, which serialises writers
+
+    def __init__(self, directory):
+        self.path = os.path.join(directory, "launchpad.db")
+
+    def location(self, store):
+        return self.path
+
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute("CREATE TABLE IF NOT EXISTS stores (store TEXT PRIMARY KEY, updated REAL NOT NULL, schema_version INTEGER NOT NULL DEFAULT 1)")
+        connection.execute("CREATE TABLE IF NOT EXISTS records (store TEXT NOT NULL, key TEXT NOT NULL, data TEXT NOT NULL, PRIMARY KEY (store, key))")
+        if "schema_version" not in [column[1] for column in connection.execute("PRAGMA table_info(stores)")]:
+            connection.execute("ALTER TABLE stores ADD COLUMN schema_version INTEGER NOT NULL DEFAULT 1")
+        return connection
+
+    def exists(self, store):
+        if not os.path.exists(self.path):
+            return False
+        with closing(self.connect()) as connection:
+            return connection.execute("SELECT 1 FROM stores WHERE store = ?", (store,)).fetchone() is not None
+
+    def read(self, store):
+        """Return (records, schema_version)."""
+        with closing(self.connect()) as connection:
+            return self.read_records(connection, store)
+
+    def read_records(self, connection, store):
+        rows = connection.execute("SELECT data FROM records WHERE store = ? ORDER BY rowid", (store,)).fetchall()
+        version = connection.execute("SELECT schema_version FROM stores WHERE store = ?", (store,)).fetchone()
+        return [json.loads(data) for (data,) in rows], version[0] if version else 1
+
+    def write(self, store, records):
+        self.update(store, lambda signature, read: records)
+
+    def update(self, store, merge):
+        """Write merge(signature, read) over the store in one transaction and return the new signature."""
+        with closing(self.connect()) as connection:
+            connection.isolation_level = None  # Transactions are managed explicitly below
+            # IMMEDIATE takes the write lock up front, so no other client can save between our check, read and write
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute("SELECT updated FROM stores WHERE store = ?", (store,)).fetchone()
+                records = merge(row[0] if row else None, lambda: self.read_records(connection, store))
+                existing = dict(connection.execute("SELECT key, data FROM records WHERE store = ?", (store,)).fetchall())
+                keys = record_keys(store, records)
+                for key, record in zip(keys, records):
+                    data = json.dumps(record, sort_keys=True)
+                    if key not in existing:
+                        connection.execute("INSERT INTO records (store, key, data) VALUES (?, ?, ?)", (store, key, data))
+                    elif existing[key] != data:
+                        # UPDATE keeps the rowid, so the record keeps its position
+                        connection.execute("UPDATE records SET data = ? WHERE store = ? AND key = ?", (data, store, key))
+                removed = set(existing) - set(keys)
+                connection.executemany("DELETE FROM records WHERE store = ? AND key = ?", [(store, key) for key in removed])
+                updated = time.time()
+                connection.execute("INSERT OR REPLACE INTO stores (store, updated, schema_version) VALUES (?, ?, ?)", (store, updated, SCHEMA_VERSION))
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return updated
+
+    def signature(self, store):
+        # Every write stamps the store row, so the stamp alone tells whether another client saved
+        if not os.path.exists(self.path):
+            return None
+        with closing(self.connect()) as connection:
+            row = connection.execute("SELECT updated FROM stores WHERE store = ?", (store,)).fetchone()
+        return row[0] if row else None
+
+DEFAULT_COMMANDS = [
+    {"title": "Open Elevated CMD", "steps": [{"type": "command", "content": "cmd /k", "delay": 0}], "shell": "CMD", "elevated": True, "pause_between_commands": False},
+    {"title": "Open Elevated PowerShell", "steps": [{"type": "command", "content": "powershell", "delay": 0}], "shell": "PowerShell", "elevated": True, "pause_between_commands": False},
+    {"title": "Open Elevated Terminal", "steps": [{"type": "command", "content": "wt", "delay": 0}], "shell": "Terminal", "elevated": True, "pause_between_commands": False},
+    {"title": "Reset AD Password", "steps": [{"type": "command", "content": "password.amazon.com", "delay": 0}], "shell": "CMD", "elevated": False, "pause_between_commands": False},
+    {"title": "Clear DNS Cache", "steps": [{"type": "command", "content": "ipconfig /flushdns", "delay": 500}, {"type": "command", "content": "nslookup <domain>", "delay": 0}], "shell": "CMD", "elevated": False, "pause_between_commands": False},
+    {"title": "Check Open Ports", "steps": [{"type": "command", "content": "netstat -a | findstr LISTENING", "delay": 500}, {"type": "output", "content": "Review output for active listeners.", "delay": 0}, {"type": "output", "content": "Note: Use netstat -an for faster numerical output.", "delay": 0}], "shell": "CMD", "elevated": False, "pause_between_commands": True}
+]
+
+DEFAULT_LINKS = [
+    {"name": "Team Wiki", "url": "https://wiki.example.com", "tooltip": "Wiki resources", "icon": "icon-wiki.png"},
+    {"name": "IT Policies", "url": "https://policies.example.com", "tooltip": "Company IT policies", "icon": "icon-policy.png"},
+    {"name": "Helpdesk", "url": "https://helpdesk.example.com", "tooltip": "Submit or view tickets", "icon": "icon-helpdesk.png"},
+    {"name": "IT Dashboard", "url": "https://dashboard.example.com", "tooltip": "IT metrics and stats", "icon": "icon-dashboard.png"},
+    {"name": "Support Portal", "url": "https://support.example.com", "tooltip": "Access support resources", "icon": "icon-support.png"},
+    {"name": "Outlook", "url": "outlook.exe", "tooltip": "Launch local Outlook client", "icon": "icon-outlook.png"},
+    {"name": "OWA", "url": "https://outlook.office365.com", "tooltip": "Open Outlook Web App", "icon": "icon-owa.png"}
+]
+
+DEFAULT_GUIDES = [
+    {"title": "Set Up VPN", "description": '<p style="font-size: 16px;">Guide to configure VPN for remote access.</p>', "steps": '<ol style="font-size: 16px;"><li>Download VPN client from IT portal</li><li>Install the client</li><li>Enter company credentials</li><li>Connect to the VPN server</li></ol>'},
+    {"title": "Access Shared Drive", "description": '<p style="font-size: 16px;">Steps to access the company shared drive.</p>', "steps": '<ol style="font-size: 16px;"><li>Connect to VPN</li><li>Open File Explorer</li><li>Navigate to \\\\server\\share</li><li>Enter credentials if prompted</li></ol>'}
+]
+
+DEFAULT_STORES = {"commands": DEFAULT_COMMANDS, "links": DEFAULT_LINKS, "guides": DEFAULT_GUIDES}
+
+STORAGE_BACKENDS = {"JSON": JsonStorageBackend, "SQLite": SqliteStorageBackend}
+
+def copy_stores(source, target, context=None):
+    """
+    Copy every existing store from one storage backend to another, upgrading old ones on the way; returns
+    {store: record count}. What migrations move out of the records, like link colors, is left in context.
+    """
+    copied = {}
+    for store in STORE_FILENAMES:
+        if source.exists(store):
+            records, version = source.read(store)
+            target.write(store, upgrade_schema(store, records, version, context))
+            copied[store] = len(records)
+    return copied
+
+class BackgroundTask(QObject):
+    # Runs work() on a daemon thread and delivers (result, error) back on the GUI thread
+    finished = pyqtSignal(object, object)
+    def __init__(self, work, callback=None, parent=None):
+        super().__init__(parent)
+        self.work = work
+        if callback:
+            self.finished.connect(callback)
+
+    def start(self):
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        try:
+            result, error = self.work(), None
+        except Exception as e:
+            result, error = None, e
+        self.finished.emit(result, error)
+
+class BrowserDetectionService:
+    # Detects installed browsers once per process and persists the result between runs
+    CACHE_MAX_AGE = 24 * 60 * 60
+    _instance = None
+
+    def __init__(self, cache_file):
+        self.cache_file = cache_file
+        self.browsers = []
+        self.browser_paths = {}
+        self.detected = False
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls(os.path.join(get_app_data_dir(), "browsers.json"))
+        return cls._instance
+
+    def get(self):
+        if not self.detected and not self.load_cache():
+            self.redetect()
+        return self.browsers, self.browser_paths
+
+    def redetect(self):
+        self.browsers, self.browser_paths = get_installed_browsers()
+        self.detected = True
+        self.save_cache()
+        return self.browsers, self.browser_paths
+
+    def load_cache(self):
+        # The cached result is valid while its executables still exist and the default handler is unchanged
+        try:
+            with open(self.cache_file, 'r') as f:
+                cache = json.load(f)
+            if time.time() - cache["detected_at"] > self.CACHE_MAX_AGE:
+                return False
+            if cache["prog_id"] != get_default_browser_prog_id():
+                return False
+            if not all(os.path.exists(path) for path in cache["browser_paths"].values()):
+                return False
+            self.browsers, self.browser_paths = cache["browsers"], cache["browser_paths"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        self.detected = True
+        return True
+
+    def save_cache(self):
+        cache = {
+            "detected_at": time.time(),
+            "prog_id": get_default_browser_prog_id(),
+            "browsers": self.browsers,
+            "browser_paths": self.browser_paths
+        }
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, 'w') as f:
+                json.dump(cache, f, indent=4)
+        except OSError as e:
+            print(f"Failed to save browser detection cache: {str(e)}")
+
+def darken_color(hex_color, factor=0.8):
+    """Hover shade of a #rrggbb link color."""
+    hex_color = hex_color.lstrip('#')
+    rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    darkened = tuple(int(c * factor) for c in rgb)
+    return f"#{darkened[0]:02x}{darkened[1]:02x}{darkened[2]:02x}"
+
+# Tile view geometry, matching a LinkButtonWidget: 150x56 button over a 20px browser box, 5px apart
+TILE_WIDTH = 150
+TILE_BUTTON_HEIGHT = 56
+TILE_BROWSER_HEIGHT = 20
+TILE_CELL_WIDTH = TILE_WIDTH + 5
+TILE_CELL_HEIGHT = TILE_BUTTON_HEIGHT + 2 + TILE_BROWSER_HEIGHT + 5
+TILE_DELIMITER_HEIGHT = 20
+
+def link_tile_regions(cell):
+    """Button, star badge, EDIT badge and browser box of the tile painted in a LinkTileView cell."""
+    x, y = cell.x(), cell.y()
+    return (QRect(x, y, TILE_WIDTH, TILE_BUTTON_HEIGHT), QRect(x + 4, y + 4, 28, 20), QRect(x + 117, y + 4, 28, 20),
+            QRect(x, y + TILE_BUTTON_HEIGHT + 2, TILE_WIDTH, TILE_BROWSER_HEIGHT))
+
 class ClickableLabel(QLabel):
     clicked = pyqtSignal()
     def __init__(self, text, parent=None):
@@ -395,13 +1617,26 @@ class SettingsDialog(QDialog):
         self.path_input = QLineEdit(self.current_settings.get("network_path", ""))
         self.path_input.setPlaceholderText("e.g., \\\\server\\share\\path")
         layout.addRow("Network Share Path:", self.path_input)
+        self.backend_combo = QComboBox()
+        self.backend_combo.addItems(list(STORAGE_BACKENDS))
+        self.backend_combo.setCurrentText(self.current_settings.get("storage_backend", "JSON"))
+        layout.addRow("Shared Storage Backend:", self.backend_combo)
         self.oncall_email_input = QLineEdit(self.current_settings.get("oncall_email", "page-ots-oncall-nbwi1@amazon.com"))
         self.oncall_email_input.setPlaceholderText("e.g., oncall@team.com")
         layout.addRow("On-Call Email:", self.oncall_email_input)
+        self.lock_timeout_input = QSpinBox()
+        self.lock_timeout_input.setRange(1, 300)
+        self.lock_timeout_input.setSuffix(" s")
+        self.lock_timeout_input.setValue(self.current_settings.get("lock_timeout", 10))
+        layout.addRow("File Lock Timeout:", self.lock_timeout_input)
+        self.snapshot_checkbox = QCheckBox("Keep a startup snapshot for faster launches")
+        self.snapshot_checkbox.setChecked(self.current_settings.get("startup_snapshot", True))
+        layout.addRow(self.snapshot_checkbox)
         self.clear_cache_button = QPushButton("Clear Help Cache")
         self.clear_cache_button.clicked.connect(self.clear_help_cache)
         layout.addRow(self.clear_cache_button)
         self.path_input.setEnabled(self.mode_combo.currentText() == "Shared")
+        self.backend_combo.setEnabled(self.mode_combo.currentText() == "Shared")
         self.mode_combo.currentTextChanged.connect(self.toggle_path_input)
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.accepted.connect(self.validate_and_accept)
@@ -411,6 +1646,7 @@ class SettingsDialog(QDialog):
 
     def toggle_path_input(self, mode):
         self.path_input.setEnabled(mode == "Shared")
+        self.backend_combo.setEnabled(mode == "Shared")
 
     def clear_help_cache(self):
         for dialog in QApplication.topLevelWidgets():
@@ -437,9 +1673,11 @@ class SettingsDialog(QDialog):
             except Exception as e:
                 QMessageBox.warning(self, "Input Error", f"Error accessing network path: {str(e)}")
                 return
-            self.settings = {"mode": "Shared", "network_path": network_path, "oncall_email": oncall_email}
+            self.settings = {"mode": "Shared", "network_path": network_path, "oncall_email": oncall_email, "storage_backend": self.backend_combo.currentText()}
         else:
             self.settings = {"mode": "Local", "network_path": "", "oncall_email": oncall_email}
+        self.settings["lock_timeout"] = self.lock_timeout_input.value()
+        self.settings["startup_snapshot"] = self.snapshot_checkbox.isChecked()
         self.accept()
 
     def get_settings(self):
@@ -529,8 +1767,7 @@ class LinkButtonWidget(QWidget):
         self.launch_callback = launch_callback
         self.edit_callback = edit_callback
         self.main_app = main_app
-        self.browsers, self.browser_paths = get_installed_browsers()
-        self.main_app.browser_paths = self.browser_paths
+        self.browsers, self.browser_paths = self.main_app.browser_service.get()
         self.setup_ui()
 
     def setup_ui(self):
@@ -544,7 +1781,7 @@ class LinkButtonWidget(QWidget):
         link_key = self.main_app.get_link_settings_key(self.link["name"])
         link_settings = self.main_app.user_preferences["link_settings"].get(link_key, {})
         button_color = link_settings.get("color", "#0078d4")
-        hover_color = self.darken_color(button_color, 0.8)
+        hover_color = darken_color(button_color, 0.8)
         self.main_button.setStyleSheet(f"""
             QLabel {{
                 background-color: {button_color};
@@ -563,12 +1800,7 @@ class LinkButtonWidget(QWidget):
         self.main_button.clicked.connect(self.launch_default)
         layout.addWidget(self.main_button)
 
-        local_extensions = ('.exe', '.txt', '.pdf', '.docx', '.xlsx', '.xlsm', '.bat', '.dotx', '.py')
-        url = self.link["url"].strip()
-        url_normalized = os.path.normpath(url).lower()
-        self.is_url = url_normalized.startswith(("http://", "https://"))
-        url_basename = os.path.basename(url_normalized)
-        self.is_local_file = not self.is_url and (any(url_basename.endswith(ext) for ext in local_extensions) or any(url_normalized.endswith(ext) for ext in local_extensions))
+        self.is_local_file = self.main_app.is_local_link(self.link["url"])
 
         self.browser_combo = QComboBox()
         if self.is_local_file:
@@ -635,45 +1867,21 @@ class LinkButtonWidget(QWidget):
         self.setLayout(layout)
 
     def toggle_favorite(self):
-        # Toggle the favorite status in user preferences using mode-specific key
-        link_key = self.main_app.get_link_settings_key(self.link["name"])
-        link_settings = self.main_app.user_preferences["link_settings"].get(link_key, {})
-        link_settings["favorite"] = not link_settings.get("favorite", False)
-        self.main_app.user_preferences["link_settings"][link_key] = link_settings
-        # Update the star icon
-        self.favorite_label.setText("★" if link_settings["favorite"] else "☆")
-        # Save the updated user preferences
-        self.main_app.save_user_preferences()
-        # Find the search bar and get its current query
-        search_widget = self.main_app.launchpad_widget.findChild(QLineEdit)
-        current_query = search_widget.text() if search_widget else ""
-        # Refresh the Launchpad tab with the current query
-        self.main_app.filter_links(current_query)
-
-    def darken_color(self, hex_color, factor=0.8):
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        darkened = tuple(int(c * factor) for c in rgb)
-        return f"#{darkened[0]:02x}{darkened[1]:02x}{darkened[2]:02x}"
+        # The button is pooled, so it survives the re-filter and only its star needs updating
+        favorite = self.main_app.toggle_favorite(self.link)
+        self.favorite_label.setText("★" if favorite else "☆")
 
     def launch_default(self):
-        url = self.link["url"]
-        if "<whid>" in url.lower() or "<WHID>" in url:
-            whid, ok = QInputDialog.getText(self, "WHID Input", "Enter WHID for this link:")
-            if not ok or not whid.strip():
-                QMessageBox.warning(self, "Input Error", "A valid WHID is required.")
-                return
-            whid_input = whid.strip()
-            if "<WHID>" in url:
-                url = url.replace("<WHID>", whid_input.upper())
-            if "<whid>" in url:
-                url = url.replace("<whid>", whid_input.lower())
+        url = self.main_app.resolve_link_url(self.link["url"], self)
+        if url is None:
+            return
 
         if self.is_local_file:
             self.launch_callback(url, None)
         else:
             selected_browser = self.browser_combo.currentText()
             self.launch_callback(url, selected_browser if selected_browser else None)
+        self.main_app.record_link_launch(self.link)
 
     def save_browser_choice(self, browser):
         if browser and not self.is_local_file:
@@ -692,6 +1900,215 @@ class LinkButtonWidget(QWidget):
         self.favorite_label.setVisible(False)
         super().leaveEvent(event)
 
+class LinkTileModel(QAbstractTableModel):
+    # Links laid out row by row for LinkTileView: favorites, an optional delimiter row, then the rest
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.favorites, self.others, self.show_delimiter = [], [], False
+        self.columns = 1
+        self.rows = []  # Each row is a list of up to columns links, or None for the delimiter
+        self.delimiter_index = None
+
+    def set_links(self, favorites, others, show_delimiter):
+        self.favorites, self.others, self.show_delimiter = favorites, others, show_delimiter
+        self.set_columns(self.columns)
+
+    def set_columns(self, columns):
+        def chunk(links):
+            return [links[i:i + columns] for i in range(0, len(links), columns)]
+        self.beginResetModel()
+        self.columns = columns
+        favorite_rows = chunk(self.favorites)
+        self.delimiter_index = len(favorite_rows) if self.show_delimiter else None
+        self.rows = favorite_rows + ([None] if self.show_delimiter else []) + chunk(self.others)
+        self.endResetModel()
+
+    def link_at(self, index):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        if row is None or index.column() >= len(row):
+            return None
+        return row[index.column()]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.columns
+
+    def data(self, index, role=Qt.DisplayRole):
+        # The view and delegate use link_at(); item data would hand out copies of the link records
+        link = self.link_at(index)
+        if link is None:
+            return None
+        if role == Qt.DisplayRole:
+            return link["name"]
+        if role == Qt.ToolTipRole:
+            return link["tooltip"]
+        return None
+
+class LinkTileDelegate(QStyledItemDelegate):
+    # Paints a tile that looks like a LinkButtonWidget; the star and EDIT badges show while hovered
+    def __init__(self, main_app, parent=None):
+        super().__init__(parent)
+        self.main_app = main_app
+
+    def paint(self, painter, option, index):
+        model = index.model()
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        font = QFont(option.font)
+        if model.rows[index.row()] is None:
+            painter.fillRect(option.rect, QColor("#2b2b2b"))
+            painter.setPen(QColor("#666"))
+            painter.drawLine(option.rect.topLeft(), option.rect.topRight())
+            painter.drawLine(option.rect.bottomLeft(), option.rect.bottomRight())
+            font.setPixelSize(12)
+            painter.setFont(font)
+            painter.setPen(QColor("#ffeb3b"))
+            painter.drawText(option.rect, Qt.AlignCenter, "Favorites Above | Regular Links Below")
+            painter.restore()
+            return
+        link = model.link_at(index)
+        if link is None:
+            painter.restore()
+            return
+        button_rect, star_rect, edit_rect, browser_rect = link_tile_regions(option.rect)
+        link_key = self.main_app.get_link_settings_key(link["name"])
+        link_settings = self.main_app.user_preferences["link_settings"].get(link_key, {})
+        button_color = link_settings.get("color", "#0078d4")
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        painter.setPen(QColor("#555"))
+        painter.setBrush(QColor(darken_color(button_color, 0.8) if hovered else button_color))
+        painter.drawRoundedRect(button_rect, 5, 5)
+        font.setPixelSize(14)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(Qt.white)
+        painter.drawText(button_rect.adjusted(8, 8, -8, -8), Qt.AlignCenter | Qt.TextWordWrap, link["name"])
+        # The browser box stands in for the browser combo; clicking it opens the browser menu
+        painter.setPen(QColor("#555"))
+        painter.setBrush(QColor("#444"))
+        painter.drawRoundedRect(browser_rect, 3, 3)
+        font.setPixelSize(12)
+        font.setBold(False)
+        painter.setFont(font)
+        painter.setPen(Qt.white if not self.main_app.is_local_link(link["url"]) else QColor("#aaa"))
+        browser_text = "Launch" if self.main_app.is_local_link(link["url"]) else f"{self.main_app.link_browser(link) or 'Default browser'} ▾"
+        painter.drawText(browser_rect.adjusted(5, 0, -5, 0), Qt.AlignVCenter | Qt.AlignLeft, browser_text)
+        if hovered:
+            badges = ((star_rect, "★" if link_settings.get("favorite", False) else "☆", "#ffeb3b", 14), (edit_rect, "EDIT", "#fff", 9))
+            for rect, text, color, size in badges:
+                painter.setPen(QColor("#777"))
+                painter.setBrush(QColor(0, 0, 0, 50))
+                painter.drawRect(rect)
+                font.setPixelSize(size)
+                font.setBold(True)
+                painter.setFont(font)
+                painter.setPen(QColor(color))
+                painter.drawText(rect, Qt.AlignCenter, text)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(TILE_CELL_WIDTH, TILE_CELL_HEIGHT)
+
+class LinkTileView(QTableView):
+    # Virtualized alternative to the link button grid: no widgets per link, and only visible tiles are painted
+    def __init__(self, main_app, parent=None):
+        super().__init__(parent)
+        self.main_app = main_app
+        self.setModel(LinkTileModel(self))
+        self.setItemDelegate(LinkTileDelegate(main_app, self))
+        for header, size in ((self.horizontalHeader(), TILE_CELL_WIDTH), (self.verticalHeader(), TILE_CELL_HEIGHT)):
+            header.hide()
+            header.setSectionResizeMode(QHeaderView.Fixed)
+            header.setDefaultSectionSize(size)
+        self.setShowGrid(False)
+        self.setSelectionMode(QTableView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)  # A scroll bar that came and went would change the column count
+        self.setVerticalScrollMode(QTableView.ScrollPerPixel)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WA_Hover)  # Hover state drives the darker color and the badges
+        self.setStyleSheet("QTableView { background-color: #333; border: none; }")
+        self.model().modelReset.connect(self.update_delimiter)
+
+    def fit_columns(self):
+        columns = max(1, self.viewport().width() // TILE_CELL_WIDTH)
+        if columns != self.model().columns:
+            self.model().set_columns(columns)
+
+    def update_delimiter(self):
+        # The delimiter is one short row spanning every column
+        self.clearSpans()
+        row = self.model().delimiter_index
+        if row is not None:
+            if self.model().columns > 1:
+                self.setSpan(row, 0, 1, self.model().columns)
+            self.setRowHeight(row, TILE_DELIMITER_HEIGHT)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.fit_columns()
+
+    def mousePressEvent(self, event):
+        index = self.indexAt(event.pos())
+        link = self.model().link_at(index)
+        if link is None or event.button() != Qt.LeftButton:
+            super().mousePressEvent(event)
+            return
+        button_rect, star_rect, edit_rect, browser_rect = link_tile_regions(self.visualRect(index))
+        if star_rect.contains(event.pos()):
+            self.main_app.toggle_favorite(link)
+        elif edit_rect.contains(event.pos()):
+            self.main_app.edit_link(link)
+        elif button_rect.contains(event.pos()):
+            self.main_app.launch_link(link, self.main_app.link_browser(link), self)
+        elif browser_rect.contains(event.pos()) and not self.main_app.is_local_link(link["url"]):
+            self.show_browser_menu(link, browser_rect.bottomLeft())
+        event.accept()
+
+    def show_browser_menu(self, link, pos):
+        browsers, _ = self.main_app.browser_service.get()
+        current = self.main_app.link_browser(link)
+        menu = QMenu(self)
+        for browser in browsers:
+            action = menu.addAction(browser)
+            action.setCheckable(True)
+            action.setChecked(browser == current)
+        chosen = menu.exec_(self.viewport().mapToGlobal(pos))
+        if chosen:
+            self.main_app.save_browser_choice(link["name"], chosen.text())
+            self.viewport().update()
+
+class LazyTab(QWidget):
+    # Placeholder tab page that builds its real widget the first time it is activated
+    def __init__(self, builder, parent=None):
+        super().__init__(parent)
+        self.builder = builder
+        self.content = None
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+    def is_built(self):
+        return self.content is not None
+
+    def ensure_built(self):
+        if self.content is None:
+            self.content = self.builder()
+            self.layout().addWidget(self.content)
+        return self.content
+
+    def reset(self):
+        # Drop the built widget so the next activation rebuilds it from current data
+        if self.content is not None:
+            self.layout().removeWidget(self.content)
+            self.content.deleteLater()
+            self.content = None
+
 class ActionButtonWidget(QWidget):
     def __init__(self, text, callback, is_oncall=False):
         super().__init__()
@@ -1316,7 +2733,41 @@ class ImportGuidesDialog(QDialog):
             guide = item.data(Qt.UserRole)
             selected_guides.append(guide)
         return selected_guides
-        
+
+class ImportSummaryDialog(QDialog):
+    # One summary for every duplicate in an import, with a single strategy applied to all of them
+    def __init__(self, store, total, duplicates, invalid, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Import Summary")
+        layout = QVBoxLayout()
+        summary = f"{total} {store} read, {len(duplicates)} with a title that already exists."
+        if invalid:
+            summary += f" {invalid} invalid records will be ignored."
+        layout.addWidget(QLabel(summary))
+        duplicate_list = QListWidget()
+        duplicate_list.addItems(duplicates[:200])
+        if len(duplicates) > 200:
+            duplicate_list.addItem(f"... and {len(duplicates) - 200} more")
+        layout.addWidget(duplicate_list)
+        self.skip_radio = QRadioButton("Skip duplicates")
+        self.overwrite_radio = QRadioButton("Overwrite the existing records")
+        self.rename_radio = QRadioButton("Import duplicates under a new title, e.g. \"Title (2)\"")
+        self.skip_radio.setChecked(True)
+        for radio in (self.skip_radio, self.overwrite_radio, self.rename_radio):
+            layout.addWidget(radio)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        self.setLayout(layout)
+
+    def get_strategy(self):
+        if self.overwrite_radio.isChecked():
+            return "overwrite"
+        if self.rename_radio.isChecked():
+            return "rename"
+        return "skip"
+
 class HelpDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -1351,6 +2802,8 @@ class HelpDialog(QDialog):
             <ul>
                 <li>Use the "Settings" menu to switch between Local and Shared storage modes.</li>
                 <li>Edit links by hovering over them and clicking "EDIT".</li>
+                <li>Press Ctrl+K to search links, commands and guides at once; Enter opens, runs or shows the highlighted result.</li>
+                <li>Tick "Tiles" on the Launchpad to paint links in a scrolling tile view, which stays fast with thousands of links. Click a tile's browser box to pick its browser.</li>
                 <li>Check the "How-To Guides" for detailed instructions on common tasks.</li>
             </ul>
             <h3>Version Information</h3>
@@ -1408,59 +2861,139 @@ class ChangelogDialog(QDialog):
         layout.addWidget(buttons)
         self.setLayout(layout)
 
+class QuickLaunchPalette(QDialog):
+    # Ctrl+K palette: one search over links, commands and guides; Enter launches, runs or opens the highlighted result
+    KIND_LABELS = {"links": "Link", "commands": "Command", "guides": "Guide"}
+
+    def __init__(self, main_app):
+        super().__init__(main_app)
+        self.main_app = main_app
+        self.matches = []
+        self.setWindowTitle("Quick Launch")
+        self.setMinimumWidth(600)
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+        self.search = QLineEdit()
+        self.search.setPlaceholderText("Search links, commands and guides...")
+        self.search.setStyleSheet("""
+            QLineEdit {
+                background-color: #444;
+                color: #fff;
+                padding: 8px;
+                border: 1px solid #555;
+                border-radius: 5px;
+                font-size: 16px;
+            }
+        """)
+        self.search.textChanged.connect(self.update_results)
+        self.search.installEventFilter(self)
+        layout.addWidget(self.search)
+        self.results = QListWidget()
+        self.results.setStyleSheet("""
+            QListWidget {
+                background-color: #333;
+                color: #fff;
+                border: 1px solid #444;
+                font-size: 16px;
+                padding: 5px;
+            }
+            QListWidget::item:selected {
+                background-color: #555;
+            }
+        """)
+        self.results.itemActivated.connect(self.activate_item)
+        layout.addWidget(self.results)
+        self.setStyleSheet("QDialog { background-color: #2b2b2b; }")
+        self.setLayout(layout)
+
+    def eventFilter(self, obj, event):
+        # Arrow keys move through the results and Enter picks one without leaving the search box
+        if obj is self.search and event.type() == QEvent.KeyPress:
+            if event.key() in (Qt.Key_Down, Qt.Key_Up) and self.results.count():
+                step = 1 if event.key() == Qt.Key_Down else -1
+                self.results.setCurrentRow(max(0, min(self.results.count() - 1, self.results.currentRow() + step)))
+                return True
+            if event.key() in (Qt.Key_Return, Qt.Key_Enter):
+                if self.results.currentItem():
+                    self.activate_item(self.results.currentItem())
+                return True
+        return super().eventFilter(obj, event)
+
+    def update_results(self, query):
+        self.matches = self.main_app.palette_search(query)  # Kept by row; item data would only hold copies of the records
+        self.results.clear()
+        for record in self.matches:
+            kind = palette_kind(record)
+            self.results.addItem(f"[{self.KIND_LABELS[kind]}] {record['name'] if kind == 'links' else record['title']}")
+        if self.results.count():
+            self.results.setCurrentRow(0)
+
+    def activate_item(self, item):
+        record = self.matches[self.results.row(item)]
+        self.accept()
+        self.main_app.activate_palette_record(record)
+
 class MainApp(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.setWindowTitle("IT Hub")
+        self.setWindowTitle("IT Hub[*]")  # [*] shows while a store has unsaved changes
         self.setGeometry(100, 100, 800, 600)
         self.setMinimumWidth(320)
-        # Fetch commands from PATH (Windows)
-        self.default_commands = []
-        common_commands = ["net", "ipconfig", "nslookup", "netstat", "ping", "tracert", "sc", "cmd", "powershell", "wt", "wmic", "echo"]
-        for cmd in common_commands:
-            self.default_commands.append(cmd.lower())  # Add explicitly
-        # Fetch CMD built-ins
-        try:
-            cmd_output = subprocess.check_output("cmd /c help", shell=True, text=True).splitlines()
-            for line in cmd_output:
-                cmd = line.strip().split()[0].lower()
-                if cmd and cmd not in self.default_commands and len(cmd) > 1:
-                    self.default_commands.append(cmd)
-        except subprocess.CalledProcessError:
-            pass
-        # Fetch PowerShell cmdlets
-        try:
-            ps_output = subprocess.check_output('powershell -Command "Get-Command -CommandType Cmdlet | ForEach-Object { $_.Name }"', shell=True, text=True).splitlines()
-            for cmdlet in ps_output:
-                cmd = cmdlet.strip().lower()
-                if cmd and cmd not in self.default_commands:
-                    self.default_commands.append(cmd)
-        except subprocess.CalledProcessError:
-            pass
-
         self.custom_commands = []
-        self.app_data_dir = os.path.join(os.getenv('LOCALAPPDATA'), 'LaunchPad')
+        self.app_data_dir = get_app_data_dir()
         os.makedirs(self.app_data_dir, exist_ok=True)
         self.settings_file = os.path.join(self.app_data_dir, "settings.json")
         self.user_preferences_file = os.path.join(self.app_data_dir, "user_preferences.json")
-        self.browser_paths = {}
-        self.load_settings()
-        self.load_user_preferences()
-        if self.settings.get("mode") == "Shared":
-            network_path = self.settings.get("network_path", "")
-            self.commands_file = os.path.join(network_path, "commands.json")
-            self.links_file = os.path.join(network_path, "launchpad_links.json")
-            self.guides_file = os.path.join(network_path, "howto_guides.json")
-        else:
-            self.commands_file = os.path.join(self.app_data_dir, "commands.json")
-            self.links_file = os.path.join(self.app_data_dir, "launchpad_links.json")
-            self.guides_file = os.path.join(self.app_data_dir, "howto_guides.json")
-        self.load_commands()
-        self.load_links()
-        self.load_guides()
+        # Command vocabulary comes from the on-disk cache; the shells are only probed in the background
+        self.default_commands = []
+        self.vocabulary_cache_file = os.path.join(self.app_data_dir, "command_vocabulary.json")
+        self.background_tasks = set()
+        self.startup_timings = {}  # Phase name -> seconds, read by launchpad_benchmark.py
+        self.saved_digests = {}  # Store name -> content digest of what was last read from or written to disk
+        self.dirty_flags = {}  # Store name -> whether it differed from disk when last checked, for the title bar marker
+        self.store_signatures = {}  # Store name -> change signature of the file/rows last read or written
+        self.store_bases = {}  # Store name -> records as last read or written, the base for merging saves
+        self.store_write_locks = {store: threading.Lock() for store in STORE_FILENAMES}  # Serialises this instance's saves of each store
+        self.snapshot_file = os.path.join(self.app_data_dir, "startup_snapshot.bin")
+        self.link_kinds = {}  # url -> opens a local file/program; derived data kept in the startup snapshot
+        self.search_indexes = {"links": SearchIndex(link_search_fields), "commands": SearchIndex(command_search_fields),
+                               "guides": SearchIndex(guide_search_fields)}  # Store -> index, rebuilt whenever the store is replaced
+        self.palette_index = None  # One index over links, commands and guides; built when the palette first opens
+        self.links_columns = None  # Buttons per row of the last links layout
+        self.run_command = None  # Set by the Commands tab once built
+        self.select_guide = None  # Set by the How-To Guides tab once built
+        self.reloading_stores = set()
+        self.loading_stores = set()  # Stores still being read in the background; their views show a placeholder
+        self.store_loads = {}  # Store name -> start time of its newest background load, so older loads are ignored
+        self.unreadable_stores = set()  # Stores whose file failed to load; they show defaults and are never saved
+        self.store_poll_running = False
+        self.share_reachable = True
+        self.share_synced_at = None  # When the shared stores were last known to match the share
+        self.preferences_writer = CoalescedWriter(self.write_user_preferences, 500, self)
+        self.link_usage_file = os.path.join(self.app_data_dir, "link_usage.json")
+        self.link_usage = load_link_usage(self.link_usage_file)  # Per-user, so it is never kept on the share
+        self.usage_writer = CoalescedWriter(self.write_link_usage, LINK_USAGE_WRITE_DELAY_MS, self)
+        cached_commands, vocabulary_fresh = load_command_vocabulary(self.vocabulary_cache_file)
+        self.apply_command_vocabulary(cached_commands)
+        if not vocabulary_fresh:
+            QTimer.singleShot(0, self.refresh_command_vocabulary)  # Runs once the window is shown
+        self.browser_service = BrowserDetectionService.instance()
+        self.time_startup_phase("load_settings", self.load_settings)
+        self.lock_manager = FileLockManager(timeout=self.settings.get("lock_timeout", 10))
+        self.save_generations = {}  # Store name -> number of the newest queued save
+        self.time_startup_phase("load_user_preferences", self.load_user_preferences)
+        self.configure_storage()
+        self.time_startup_phase("start_store_loads", self.load_stores_in_background)
         self.sort_order = "Alphabetical (A-Z)"  # Default to A-Z sorting
         self.search_query = ""
         self.help_files_updated = self.user_preferences.get("help_files_updated", False)
+        # Other users' edits to the shared files are picked up by polling their signatures
+        self.store_poll_timer = QTimer(self)
+        self.store_poll_timer.setInterval(STORE_POLL_INTERVAL_MS)
+        self.store_poll_timer.timeout.connect(self.poll_store_signatures)
+        self.store_poll_timer.start()
         menu_bar = self.menuBar()
         settings_menu = QMenu("Settings", self)
         configure_action = QAction("Configure JSON Storage", self)
@@ -1470,6 +3003,15 @@ class MainApp(QMainWindow):
         refresh_action.triggered.connect(self.refresh_shared_files)
         settings_menu.addAction("Add PowerShell Example", self.open_add_example_dialog)        
         settings_menu.addAction(refresh_action)
+        import_sqlite_action = QAction("Import JSON Files into SQLite", self)
+        import_sqlite_action.triggered.connect(self.import_json_into_sqlite)
+        settings_menu.addAction(import_sqlite_action)
+        export_sqlite_action = QAction("Export SQLite to JSON Files", self)
+        export_sqlite_action.triggered.connect(self.export_sqlite_to_json)
+        settings_menu.addAction(export_sqlite_action)
+        redetect_browsers_action = QAction("Re-detect Browsers", self)
+        redetect_browsers_action.triggered.connect(self.redetect_browsers)
+        settings_menu.addAction(redetect_browsers_action)
         menu_bar.addMenu(settings_menu)
         help_menu = QMenu("Help", self)
         user_guide_action = QAction("User Guide", self)
@@ -1485,11 +3027,18 @@ class MainApp(QMainWindow):
         help_menu.addAction(version_action)
         help_menu.addAction(changelog_action)
         menu_bar.addMenu(help_menu)
+        palette_action = QAction("Quick Launch", self)
+        palette_action.setShortcut("Ctrl+K")
+        palette_action.triggered.connect(self.show_palette)
+        self.addAction(palette_action)  # Window-wide shortcut without a menu entry
         self.tabs = QTabWidget()
-        self.launchpad_widget = self.launchpad_tab()
+        self.launchpad_widget = self.time_startup_phase("launchpad_tab", self.launchpad_tab)
         self.tabs.addTab(self.launchpad_widget, "Launchpad")
-        self.tabs.addTab(self.commands_tab(), "Commands")
-        self.tabs.addTab(self.howto_guides_tab(), "How-To Guides")
+        # Commands and guides are only built when their tab is first opened
+        self.commands_page = LazyTab(lambda: self.build_store_tab("commands", self.commands_tab))
+        self.guides_page = LazyTab(lambda: self.build_store_tab("guides", self.howto_guides_tab))
+        self.tabs.addTab(self.commands_page, "Commands")
+        self.tabs.addTab(self.guides_page, "How-To Guides")
         self.setCentralWidget(self.tabs)
         import ctypes
         ctypes.windll.user32.ShowWindow(ctypes.windll.kernel32.GetConsoleWindow(), 6)  # 6 = minimize
@@ -1514,9 +3063,66 @@ class MainApp(QMainWindow):
                 min-width: 250px;
             }
         """)
+        self.tabs.currentChanged.connect(self.build_current_tab)
         self.tabs.currentChanged.connect(self.update_tab_styles)
         self.update_tab_styles(0)
-        self.filter_links("")  # Ensure initial render with colors
+        self.time_startup_phase("first_filter_links", lambda: self.filter_links(""))  # Ensure initial render with colors
+        self.update_dirty_indicator()
+
+    def time_startup_phase(self, phase, func):
+        start = time.perf_counter()
+        result = func()
+        self.startup_timings[phase] = time.perf_counter() - start
+        return result
+
+    def run_in_background(self, work, callback=None, wait=False):
+        """
+        Run work() on a daemon thread; callback(result, error) is called on the GUI thread.
+        With wait=True work() runs right here and (result, error) is returned instead; a nested
+        event loop would let clicks and timers re-enter the window halfway through a save.
+        """
+        if wait:
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            try:
+                return work(), None
+            except Exception as e:
+                return None, e
+            finally:
+                QApplication.restoreOverrideCursor()
+        task = BackgroundTask(work)
+        def on_finished(result, error):
+            self.background_tasks.discard(task)
+            if callback:
+                callback(result, error)
+        task.finished.connect(on_finished)
+        self.background_tasks.add(task)  # Keep a reference until the task reports back
+        task.start()
+        return task
+
+    def apply_command_vocabulary(self, commands):
+        common_commands = ["net", "ipconfig", "nslookup", "netstat", "ping", "tracert", "sc", "cmd", "powershell", "wt", "wmic", "echo"]
+        vocabulary = list(common_commands)
+        for cmd in commands:
+            if cmd not in vocabulary:
+                vocabulary.append(cmd)
+        # Update in place so open highlighters and extract_commands see the new list
+        self.default_commands[:] = vocabulary
+        for dialog in QApplication.topLevelWidgets():
+            if isinstance(dialog, NewCommandDialog):
+                dialog.highlighter.rehighlight()
+
+    def refresh_command_vocabulary(self):
+        def probe():
+            commands = probe_command_vocabulary()
+            if commands:
+                save_command_vocabulary(self.vocabulary_cache_file, commands)
+            return commands
+        def on_probed(commands, error):
+            if error:
+                print(f"Failed to refresh command vocabulary: {str(error)}")
+            elif commands:
+                self.apply_command_vocabulary(commands)
+        self.run_in_background(probe, on_probed)
 
     def get_link_settings_key(self, link_name):
         mode = self.settings.get("mode", "Local")
@@ -1546,43 +3152,121 @@ class MainApp(QMainWindow):
             try:
                 with open(self.user_preferences_file, 'r') as f:
                     self.user_preferences = json.load(f)
+                self.mark_store_saved("user_preferences")
             except Exception as e:
                 print(f"Failed to load user preferences: {str(e)}")
-                self.user_preferences = {"link_settings": {}, "powershell_help_updated": False}
+                self.user_preferences = {"schema_version": SCHEMA_VERSION, "link_settings": {}, "powershell_help_updated": False}
         else:
-            self.user_preferences = {"link_settings": {}, "powershell_help_updated": False}
-            self.save_user_preferences()
-        # Migrate browser choices from link_browser_choices.json if it exists
+            self.user_preferences = {"link_settings": {}, "powershell_help_updated": False}  # Written by the upgrade below
+        version = self.user_preferences.get("schema_version", 1)
+        if version < SCHEMA_VERSION:
+            self.upgrade_user_preferences(version)
+
+    def upgrade_user_preferences(self, version):
+        context = {}
         browser_choices_file = os.path.join(self.app_data_dir, "link_browser_choices.json")
         if os.path.exists(browser_choices_file):
             try:
                 with open(browser_choices_file, 'r') as f:
-                    browser_choices = json.load(f)
-                for link_key, browser in browser_choices.items():
-                    if link_key in self.user_preferences["link_settings"]:
-                        self.user_preferences["link_settings"][link_key]["browser"] = browser
-                    else:
-                        self.user_preferences["link_settings"][link_key] = {"color": "#0078d4", "favorite": False, "browser": browser}
-                self.save_user_preferences()
-                os.remove(browser_choices_file)  # Delete the old file
+                    context["browser_choices"] = json.load(f)
             except Exception as e:
                 print(f"Failed to migrate browser choices: {str(e)}")
-        # Ensure powershell_help_updated exists
-        if "powershell_help_updated" not in self.user_preferences:
-            self.user_preferences["powershell_help_updated"] = False
-            self.save_user_preferences()
+        upgrade_schema("user_preferences", self.user_preferences, version, context)
+        self.user_preferences["schema_version"] = SCHEMA_VERSION
+        def remove_browser_choices():
+            try:
+                os.remove(browser_choices_file)  # Delete the old file
+            except OSError as e:
+                print(f"Failed to remove {browser_choices_file}: {str(e)}")
+        # Written straight away so the upgrade happens once, even if the app does not exit cleanly
+        self.preferences_writer.cancel()
+        self.write_user_preferences(on_saved=remove_browser_choices if "browser_choices" in context else None)
 
     def save_user_preferences(self):
-        if self.acquire_lock(self.user_preferences_file):
-            try:
-                with open(self.user_preferences_file, 'w') as f:
-                    json.dump(self.user_preferences, f, indent=4)
-            except Exception as e:
-                print(f"Debug: Save failed: {str(e)}")
-            finally:
-                self.release_lock(self.user_preferences_file)
+        # Preference changes arrive in bursts (star toggles, combo changes); write once they settle
+        self.update_dirty_indicator("user_preferences")
+        if self.dirty_flags["user_preferences"]:
+            self.preferences_writer.schedule()
+
+    def write_user_preferences(self, wait=False, on_saved=None):
+        if not self.is_store_dirty("user_preferences"):
+            return
+        text = json.dumps(self.user_preferences)
+        digest = content_digest(self.user_preferences)
+        def write():
+            write_text_atomic(self.user_preferences_file, text)
+        def on_written(result, error):
+            if isinstance(error, LockTimeoutError):
+                print(f"Debug: Lock failed for {self.user_preferences_file}")
+            elif error:
+                print(f"Debug: Save failed: {str(error)}")
+            else:
+                self.saved_digests["user_preferences"] = digest
+                if on_saved:
+                    on_saved()
+            self.update_dirty_indicator("user_preferences")
+        if wait:
+            on_written(*self.run_locked(self.user_preferences_file, write, wait=True))
+        else:
+            self.run_locked(self.user_preferences_file, write, on_written)
+
+    def resolve_link_url(self, url, parent):
+        """Fill a link's <whid>/<WHID> placeholder from the user; None if they cancel."""
+        if "<whid>" in url.lower() or "<WHID>" in url:
+            whid, ok = QInputDialog.getText(parent, "WHID Input", "Enter WHID for this link:")
+            if not ok or not whid.strip():
+                QMessageBox.warning(parent, "Input Error", "A valid WHID is required.")
+                return None
+            whid_input = whid.strip()
+            if "<WHID>" in url:
+                url = url.replace("<WHID>", whid_input.upper())
+            if "<whid>" in url:
+                url = url.replace("<whid>", whid_input.lower())
+        return url
+
+    def launch_link(self, link, browser=None, parent=None):
+        url = self.resolve_link_url(link["url"], parent or self)
+        if url is None:
+            return
+        if self.is_local_link(link["url"]):
+            self.launch_local_app(url)
+        else:
+            self.open_website(url, browser)
+        self.record_link_launch(link)
+
+    def link_browser(self, link):
+        """Browser a link opens in: its saved choice while that browser is installed, else the first one detected."""
+        browsers, _ = self.browser_service.get()
+        saved_browser = self.get_browser_choice(link["name"])
+        if saved_browser in browsers:
+            return saved_browser
+        return browsers[0] if browsers else None
+
+    def toggle_favorite(self, link):
+        # Toggle the favorite status in user preferences using mode-specific key; returns the new status
+        link_key = self.get_link_settings_key(link["name"])
+        link_settings = self.user_preferences["link_settings"].get(link_key, {})
+        link_settings["favorite"] = not link_settings.get("favorite", False)
+        self.user_preferences["link_settings"][link_key] = link_settings
+        self.save_user_preferences()
+        self.filter_links(self.search_query)
+        return link_settings["favorite"]
+
+    def record_link_launch(self, link):
+        record_link_launch(self.link_usage, self.get_link_settings_key(link["name"]), time.time())
+        self.usage_writer.schedule()  # The grid keeps its order until the next filter, so the clicked button does not jump
+
+    def write_link_usage(self, wait=False):
+        text = json.dumps({"version": LINK_USAGE_VERSION, "links": self.link_usage}, separators=(",", ":"))
+        def write():
+            write_text_atomic(self.link_usage_file, text)
+        def on_written(result, error):
+            if error:
+                print(f"Failed to save link usage: {str(error)}")
+        if wait:
+            on_written(*self.run_locked(self.link_usage_file, write, wait=True))
         else:
-            print(f"Debug: Lock failed for {self.user_preferences_file}")
+            self.run_locked(self.link_usage_file, write, on_written)
 
     def get_browser_choice(self, link_name):
         link_key = self.get_link_settings_key(link_name)
@@ -1607,172 +3291,514 @@ class MainApp(QMainWindow):
             app_data = os.getenv("LOCALAPPDATA")
             return os.path.join(app_data, "LaunchPad", filename)
 
-    def acquire_lock(self, filename):
-        lock_file = f"{filename}.lock"
-        max_attempts = 30
-        for _ in range(max_attempts):
-            if not os.path.exists(lock_file):
-                try:
-                    with open(lock_file, 'w') as f:
-                        f.write(str(os.getpid()))
-                    return True
-                except:
-                    pass
-            time.sleep(1)
-        QMessageBox.warning(self, "Error", f"Could not acquire lock for {filename}. Another user may be editing the file.")
-        return False
+    def run_locked(self, filename, work, callback=None, wait=False):
+        """Like run_in_background, but holds the lock for filename around work(); a LockTimeoutError is reported as the error."""
+        return self.run_locked_files([filename], work, callback, wait)
 
-    def release_lock(self, filename):
-        lock_file = f"{filename}.lock"
-        if os.path.exists(lock_file):
+    def run_locked_files(self, filenames, work, callback=None, wait=False):
+        """Like run_locked, but holds the locks of all filenames, taken in sorted order so two callers cannot deadlock."""
+        def locked_work():
+            acquired = []
             try:
-                os.remove(lock_file)
-            except:
-                pass
+                for filename in sorted(set(filenames)):
+                    if not self.lock_manager.acquire(filename):
+                        raise LockTimeoutError(filename)
+                    acquired.append(filename)
+                return work()
+            finally:
+                for filename in reversed(acquired):
+                    self.lock_manager.release(filename)
+        return self.run_in_background(locked_work, callback, wait)
 
-    def load_commands(self):
-        default_commands = [
-            {"title": "Open Elevated CMD", "steps": [{"type": "command", "content": "cmd /k", "delay": 0}], "shell": "CMD", "elevated": True, "pause_between_commands": False},
-            {"title": "Open Elevated PowerShell", "steps": [{"type": "command", "content": "powershell", "delay": 0}], "shell": "PowerShell", "elevated": True, "pause_between_commands": False},
-            {"title": "Open Elevated Terminal", "steps": [{"type": "command", "content": "wt", "delay": 0}], "shell": "Terminal", "elevated": True, "pause_between_commands": False},
-            {"title": "Reset AD Password", "steps": [{"type": "command", "content": "password.amazon.com", "delay": 0}], "shell": "CMD", "elevated": False, "pause_between_commands": False},
-            {"title": "Clear DNS Cache", "steps": [{"type": "command", "content": "ipconfig /flushdns", "delay": 500}, {"type": "command", "content": "nslookup <domain>", "delay": 0}], "shell": "CMD", "elevated": False, "pause_between_commands": False},
-            {"title": "Check Open Ports", "steps": [{"type": "command", "content": "netstat -a | findstr LISTENING", "delay": 500}, {"type": "output", "content": "Review output for active listeners.", "delay": 0}, {"type": "output", "content": "Note: Use netstat -an for faster numerical output.", "delay": 0}], "shell": "CMD", "elevated": False, "pause_between_commands": True}
-        ]
-        if os.path.exists(self.commands_file):
-            try:
-                if self.acquire_lock(self.commands_file):
-                    with open(self.commands_file, 'r') as f:
-                        self.commands = json.load(f)
-                    for command in self.commands:
-                        if "pause_between_commands" not in command:
-                            command["pause_between_commands"] = False
-                        if "pause_at_end" in command:
-                            command["pause_between_commands"] = command.pop("pause_at_end")
-                    self.release_lock(self.commands_file)
+    def show_lock_timeout(self, filename):
+        QMessageBox.warning(self, "Error", f"Could not acquire lock for {filename}. Another user may be editing the file.")
+
+    def storage_directory(self):
+        if self.settings.get("mode") == "Shared":
+            return self.settings.get("network_path", "")
+        return self.app_data_dir
+
+    def configure_storage(self):
+        # SQLite is only offered for Shared mode; Local mode always keeps plain JSON files
+        backend = self.settings.get("storage_backend", "JSON") if self.settings.get("mode") == "Shared" else "JSON"
+        self.storage = STORAGE_BACKENDS.get(backend, JsonStorageBackend)(self.storage_directory())
+        self.commands_file = self.storage.location("commands")
+        self.links_file = self.storage.location("links")
+        self.guides_file = self.storage.location("guides")
+
+    def run_storage(self, store, work, callback=None, wait=False):
+        # JSON stores are guarded by the file lock; SQLite relies on its own transactions
+        if self.storage.uses_file_lock:
+            return self.run_locked(self.storage.location(store), work, callback, wait)
+        return self.run_in_background(work, callback, wait)
+
+    def read_store(self, store, callback, report_errors=True):
+        """
+        Read a store through the storage backend in the background and hand (data, error) to callback
+        on the GUI thread; data is None if the store does not exist yet.
+        """
+        storage = self.storage
+        mirror_file, mirror_source = self.mirror_file(store), self.mirror_source(store)
+        def read():
+            if not storage.exists(store):
+                return None, storage.signature(store), {}
+            data, version = storage.read(store)
+            context = {}
+            if version < SCHEMA_VERSION:
+                # Upgrade the file once, while we hold its lock; later loads are plain reads
+                upgrade_schema(store, data, version, context)
+                storage.write(store, data)
+                print(f"Upgraded {store} from schema version {version} to {SCHEMA_VERSION}")
+            signature = storage.signature(store)
+            if mirror_file:
+                save_store_mirror(mirror_file, mirror_source, signature, data)
+            return data, signature, context
+        def on_read(result, error):
+            if error:
+                if report_errors and isinstance(error, LockTimeoutError):
+                    self.show_lock_timeout(storage.location(store))
+                elif report_errors:
+                    QMessageBox.warning(self, "Error", f"Failed to load {store} from file: {str(error)}\nUsing default {store}.")
                 else:
-                    self.commands = default_commands
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Failed to load commands from file: {str(e)}\nUsing default commands.")
-                self.commands = default_commands
+                    print(f"Failed to load {store}: {str(error)}")
+                return None, error
+            data, signature, context = result
+            if storage is self.storage:  # A read from before a storage change must not overwrite the new signature
+                self.store_signatures[store] = signature
+            if context.get("link_settings"):
+                self.adopt_migrated_link_settings(context["link_settings"])
+            return data, None
+        self.run_storage(store, read, lambda result, error: callback(*on_read(result, error)))
+
+    def apply_store(self, store, data, error):
+        self.loading_stores.discard(store)
+        if error:
+            self.replace_store(store, copy.deepcopy(DEFAULT_STORES[store]))
+            self.mark_store_saved(store)
+            self.unreadable_stores.add(store)  # Never let fallback defaults, or edits made on top of them, overwrite the file
+            return
+        self.unreadable_stores.discard(store)
+        if data is None:
+            self.replace_store(store, copy.deepcopy(DEFAULT_STORES[store]))
+            self.saved_digests.pop(store, None)
+            self.store_bases[store] = []
+            if store == "guides":
+                self.save_guides()
         else:
-            self.commands = default_commands
-
-    def load_links(self):
-        default_links = [
-            {"name": "Team Wiki", "url": "https://wiki.example.com", "tooltip": "Wiki resources", "icon": "icon-wiki.png"},
-            {"name": "IT Policies", "url": "https://policies.example.com", "tooltip": "Company IT policies", "icon": "icon-policy.png"},
-            {"name": "Helpdesk", "url": "https://helpdesk.example.com", "tooltip": "Submit or view tickets", "icon": "icon-helpdesk.png"},
-            {"name": "IT Dashboard", "url": "https://dashboard.example.com", "tooltip": "IT metrics and stats", "icon": "icon-dashboard.png"},
-            {"name": "Support Portal", "url": "https://support.example.com", "tooltip": "Access support resources", "icon": "icon-support.png"},
-            {"name": "Outlook", "url": "outlook.exe", "tooltip": "Launch local Outlook client", "icon": "icon-outlook.png"},
-            {"name": "OWA", "url": "https://outlook.office365.com", "tooltip": "Open Outlook Web App", "icon": "icon-owa.png"}
-        ]
-        if os.path.exists(self.links_file):
-            try:
-                if self.acquire_lock(self.links_file):
-                    with open(self.links_file, 'r') as f:
-                        self.links = json.load(f)
-                    # Migrate existing color and favorite fields to user preferences
-                    for link in self.links:
-                        link_name = link["name"]
-                        link_key = self.get_link_settings_key(link_name)
-                        if "color" in link or "favorite" in link:
-                            self.user_preferences["link_settings"][link_key] = {
-                                "color": link.get("color", "#0078d4"),
-                                "favorite": link.get("favorite", False)
-                            }
-                            # Remove color and favorite from the link
-                            link.pop("color", None)
-                            link.pop("favorite", None)
-                    # Clean up orphaned preferences
-                    current_link_names = {link["name"] for link in self.links}
-                    current_mode = self.settings.get("mode", "Local")
-                    preferences_to_remove = []
-                    for key in self.user_preferences["link_settings"]:
-                        mode, link_name = key.split(":", 1)
-                        if mode == current_mode and link_name not in current_link_names:
-                            preferences_to_remove.append(key)
-                    for key in preferences_to_remove:
-                        del self.user_preferences["link_settings"][key]
-                    self.save_user_preferences()
-                    self.release_lock(self.links_file)
-                else:
-                    self.links = default_links
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Failed to load links from file: {str(e)}\nUsing default links.")
-                self.links = default_links
+            self.replace_store(store, data)
+            self.mark_store_saved(store)
+
+    def mirror_file(self, store):
+        # Only Shared mode keeps a local copy; Local mode already reads from the app-data dir
+        if self.settings.get("mode") != "Shared":
+            return None
+        return os.path.join(self.app_data_dir, "shared_mirror", f"{store}.json")
+
+    def mirror_source(self, store):
+        return f"{self.storage.name}:{self.storage.location(store)}"
+
+    def load_snapshot(self):
+        if not self.settings.get("startup_snapshot", True):
+            return None
+        snapshot = load_startup_snapshot(self.snapshot_file)
+        if snapshot:
+            self.link_kinds = snapshot["derived"]["link_kinds"]
+        return snapshot
+
+    def snapshot_check(self, store):
+        # What a snapshot entry is validated against: the local mirror in Shared mode, the store itself otherwise
+        mirror_file = self.mirror_file(store)
+        return file_signature(mirror_file) if mirror_file else self.storage.signature(store)
+
+    def load_store_from_snapshot(self, store, snapshot):
+        entry = snapshot.get("stores", {}).get(store)
+        if not entry or entry["source"] != self.mirror_source(store):
+            return False
+        check = self.snapshot_check(store)
+        if check is None or check != entry["check"]:
+            return False
+        # Snapshot records are already migrated, and their digest was taken when they matched the file
+        if store in self.search_indexes and entry.get("search_index"):
+            setattr(self, store, entry["records"])
+            self.search_indexes[store] = entry["search_index"]  # Pickled together with the records it points to
+            self.palette_index = None
+        else:
+            self.replace_store(store, entry["records"])
+        self.saved_digests[store] = entry["digest"]
+        self.store_bases[store] = copy.deepcopy(entry["records"])
+        self.store_signatures[store] = entry["signature"]
+        if self.mirror_file(store):
+            self.share_synced_at = snapshot["saved"] if self.share_synced_at is None else min(snapshot["saved"], self.share_synced_at)
+            QTimer.singleShot(0, self.poll_store_signatures)  # Revalidate against the share, as for the mirror
+        return True
+
+    def write_snapshot(self):
+        # Written on clean exit, after every store has been saved; only stores that match their file are kept
+        if not self.settings.get("startup_snapshot", True):
+            if os.path.exists(self.snapshot_file):
+                os.remove(self.snapshot_file)
+            return
+        stores = {}
+        for store in STORE_FILENAMES:
+            # Fallback defaults of an unreadable file stay out, so the next start reads the file and warns again
+            if store in self.loading_stores or store in self.unreadable_stores or self.is_store_dirty(store):
+                continue
+            stores[store] = {
+                "source": self.mirror_source(store),
+                "check": self.snapshot_check(store),
+                "signature": self.store_signatures.get(store),
+                "digest": self.saved_digests[store],
+                "records": getattr(self, store),
+                "search_index": self.search_indexes.get(store)
+            }
+        snapshot = {
+            "saved": time.time(),
+            "stores": stores,
+            "derived": {
+                "link_kinds": {link["url"]: self.is_local_link(link["url"]) for link in self.links}
+            }
+        }
+        save_startup_snapshot(self.snapshot_file, snapshot)
+
+    def is_local_link(self, url):
+        if url not in self.link_kinds:
+            self.link_kinds[url] = is_local_link(url)
+        return self.link_kinds[url]
+
+    def replace_store(self, store, records):
+        setattr(self, store, records)
+        if store in self.search_indexes:
+            self.search_indexes[store].rebuild(records)
+            self.palette_index = None  # Rebuilt from all stores the next time the palette opens
+
+    def indexes_for(self, store):
+        """Search indexes that hold the records of store and must see every edit."""
+        indexes = [self.search_indexes[store]]
+        if self.palette_index is not None:
+            indexes.append(self.palette_index)
+        return indexes
+
+    def index_add(self, store, record):
+        for index in self.indexes_for(store):
+            index.add(record)
+
+    def index_remove(self, store, record):
+        for index in self.indexes_for(store):
+            index.remove(record)
+
+    def index_replace(self, store, old_record, new_record):
+        for index in self.indexes_for(store):
+            index.replace(old_record, new_record)
+
+    def palette_search(self, query):
+        """Best quick-launch matches for query across links, commands and guides."""
+        if self.palette_index is None:
+            self.palette_index = SearchIndex(palette_search_fields)
+            self.palette_index.rebuild(self.links + self.commands + self.guides)
+        return self.palette_index.ranked_search(query, PALETTE_FIELD_WEIGHTS, limit=PALETTE_MAX_RESULTS) or []
+
+    def show_palette(self):
+        QuickLaunchPalette(self).exec_()
+
+    def activate_palette_record(self, record):
+        kind = palette_kind(record)
+        if kind == "links":
+            self.launch_link(record, self.link_browser(record))
+        elif kind == "commands":
+            self.commands_page.ensure_built()
+            if self.run_command:
+                self.run_command(copy.deepcopy(record))  # Placeholder answers are written into the steps; keep them out of the store
         else:
-            self.links = default_links
+            self.tabs.setCurrentWidget(self.guides_page)
+            if self.select_guide:
+                self.select_guide(record)
+
+    def load_store_from_mirror(self, store):
+        # Shared mode starts from the local mirror; the share is revalidated in the background right after
+        mirror_file = self.mirror_file(store)
+        if not mirror_file:
+            return False
+        records, signature, saved = load_store_mirror(mirror_file, self.mirror_source(store))
+        if records is None:
+            return False
+        self.store_signatures[store] = signature
+        self.share_synced_at = saved if self.share_synced_at is None else min(saved, self.share_synced_at)
+        self.apply_store(store, records, None)
+        QTimer.singleShot(0, self.poll_store_signatures)
+        return True
+
+    def load_stores_in_background(self, cached=True):
+        # Stores without a valid snapshot entry or local mirror are read concurrently, one background task each;
+        # explicit reloads pass cached=False to read every store from the storage itself
+        snapshot = (self.time_startup_phase("load_snapshot", self.load_snapshot) or {}) if cached else {}
+        for store in STORE_FILENAMES:
+            if cached and (self.load_store_from_snapshot(store, snapshot) or self.load_store_from_mirror(store)):
+                continue
+            self.replace_store(store, [])
+            self.loading_stores.add(store)
+            started = time.perf_counter()
+            self.store_loads[store] = started
+            self.read_store(store, lambda data, error, store=store, started=started: self.on_store_loaded(store, data, error, started))
+
+    def on_store_loaded(self, store, data, error, started):
+        self.startup_timings[f"load_{store}"] = time.perf_counter() - started
+        print(f"Loaded {store} in {self.startup_timings[f'load_{store}'] * 1000:.0f} ms")
+        if store not in self.loading_stores or self.store_loads.get(store) != started:
+            return  # Superseded by a later load, e.g. after the storage settings changed
+        if not error:
+            self.share_synced_at = self.share_synced_at or time.time()
+        self.apply_store(store, data, error)
+        # Before the window exists there is nothing to replace; it is built from the loaded data
+        if store == "links" and hasattr(self, "launchpad_widget"):
+            self.filter_links(self.search_query)
+        elif store in ("commands", "guides") and hasattr(self, "guides_page"):
+            page = self.commands_page if store == "commands" else self.guides_page
+            page.reset()
+            if self.tabs.currentWidget() is page:
+                page.ensure_built()
+        self.update_dirty_indicator(store)
+
+    def check_store_loaded(self, store, parent=None):
+        """False, after telling the user, while store is still loading; edits to its empty placeholder would be lost when it arrives."""
+        if store not in self.loading_stores:
+            return True
+        QMessageBox.information(parent or self, "Still Loading", f"The {store} are still loading. Try again in a moment.")
+        return False
 
-    def load_guides(self):
-        default_guides = [
-            {"title": "Set Up VPN", "description": '<p style="font-size: 16px;">Guide to configure VPN for remote access.</p>', "steps": '<ol style="font-size: 16px;"><li>Download VPN client from IT portal</li><li>Install the client</li><li>Enter company credentials</li><li>Connect to the VPN server</li></ol>'},
-            {"title": "Access Shared Drive", "description": '<p style="font-size: 16px;">Steps to access the company shared drive.</p>', "steps": '<ol style="font-size: 16px;"><li>Connect to VPN</li><li>Open File Explorer</li><li>Navigate to \\\\server\\share</li><li>Enter credentials if prompted</li></ol>'}
-        ]
-        if os.path.exists(self.guides_file):
-            try:
-                if self.acquire_lock(self.guides_file):
-                    with open(self.guides_file, 'r') as f:
-                        self.guides = json.load(f)
-                    for guide in self.guides:
-                        if isinstance(guide["steps"], list):
-                            guide["steps"] = '<ol style="font-size: 16px;">' + "".join(f"<li>{step}</li>" for step in guide["steps"]) + "</ol>"
-                        if not guide["description"].startswith("<"):
-                            guide["description"] = f'<p style="font-size: 16px;">{guide["description"]}</p>'
-                    self.release_lock(self.guides_file)
-                else:
-                    self.guides = default_guides
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Failed to load guides from file: {str(e)}\nUsing default guides.")
-                self.guides = default_guides
+    def build_store_tab(self, store, builder):
+        if store in self.loading_stores:
+            placeholder = QLabel(f"Loading {store}...")
+            placeholder.setAlignment(Qt.AlignCenter)
+            placeholder.setStyleSheet("color: #aaa; font-size: 16px;")
+            return placeholder
+        return builder()
+
+    def adopt_migrated_link_settings(self, link_settings):
+        # Colors and favorites stripped from a version 1 links file become this user's preferences
+        for link_name, settings in link_settings.items():
+            self.user_preferences["link_settings"][self.get_link_settings_key(link_name)] = settings
+        self.save_user_preferences()
+
+    def prune_link_settings(self):
+        # Drop preferences of links that no longer exist in the current mode
+        current_link_names = {link["name"] for link in self.links}
+        current_mode = self.settings.get("mode", "Local")
+        preferences_to_remove = []
+        for key in self.user_preferences["link_settings"]:
+            mode, link_name = key.split(":", 1)
+            if mode == current_mode and link_name not in current_link_names:
+                preferences_to_remove.append(key)
+        for key in preferences_to_remove:
+            del self.user_preferences["link_settings"][key]
+        if preferences_to_remove:
+            self.save_user_preferences()
+        usage_to_remove = [key for key in self.link_usage if key.split(":", 1)[0] == current_mode and key.split(":", 1)[1] not in current_link_names]
+        for key in usage_to_remove:
+            del self.link_usage[key]
+        if usage_to_remove:
+            self.usage_writer.schedule()
+
+    def mark_store_saved(self, store):
+        self.saved_digests[store] = content_digest(getattr(self, store))
+        self.dirty_flags[store] = False
+        if store in STORE_FILENAMES:
+            self.store_bases[store] = copy.deepcopy(getattr(self, store))  # Merge base for the next save
+
+    def is_store_dirty(self, store):
+        dirty = self.dirty_flags[store] = content_digest(getattr(self, store)) != self.saved_digests.get(store)
+        return dirty
+
+    def dirty_stores(self):
+        # Stores not loaded yet (during startup) are not considered
+        return [store for store, dirty in self.dirty_flags.items() if dirty and store not in self.loading_stores]
+
+    def update_dirty_indicator(self, *stores):
+        # Only the named stores are re-hashed, so a star toggle does not hash every store; the others keep their last check
+        for store in stores or ("commands", "links", "guides", "user_preferences"):
+            if hasattr(self, store):
+                self.is_store_dirty(store)
+        self.setWindowModified(bool(self.dirty_stores()))
+
+    def save_store(self, store, wait=False):
+        # Stores whose content matches what is on disk are never rewritten, and a store still loading has nothing to save
+        if store in self.loading_stores or not self.is_store_dirty(store):
+            return
+        if store in self.unreadable_stores:
+            print(f"Not saving {store}: its file could not be read, so saving would replace it with the defaults")
+            return
+        # Snapshot on the GUI thread; serialisation and I/O happen in the background
+        records = copy.deepcopy(getattr(self, store))
+        digest = content_digest(records)
+        storage = self.storage
+        mirror_file, mirror_source = self.mirror_file(store), self.mirror_source(store)
+        generation = self.save_generations.get(store, 0) + 1
+        self.save_generations[store] = generation
+        def write():
+            outcome = {"merged": records, "conflicts": []}
+            context = {}
+            def merge(signature, read):
+                # Someone else saved since we last read or wrote: merge their records with ours instead of overwriting them
+                if signature != known_signature and signature is not None:
+                    current, version = read()
+                    upgrade_schema(store, current, version, context)  # Another client may still write version 1 files
+                    if content_digest(current) != content_digest(base):
+                        outcome["merged"], outcome["conflicts"] = merge_records(store, base, records, current)
+                return outcome["merged"]
+            # Saves of a store run one at a time, each starting from the signature and base the previous one left,
+            # so back-to-back saves do not mistake our own earlier write for another user's
+            with self.store_write_locks[store]:
+                # Checked under the lock: an older save that lost the race for it must not write over a newer one
+                if self.save_generations.get(store) != generation:
+                    return None  # A newer snapshot of this store is queued or already written
+                known_signature = self.store_signatures.get(store)
+                base = self.store_bases.get(store, [])
+                signature = storage.update(store, merge)
+                merged, conflicts = outcome["merged"], outcome["conflicts"]
+                if storage is self.storage:
+                    self.store_bases[store] = merged
+                    self.store_signatures[store] = signature  # Our own write is not an external change
+                if mirror_file:
+                    save_store_mirror(mirror_file, mirror_source, signature, merged)
+            return merged, conflicts, signature, context
+        def on_written(result, error):
+            if isinstance(error, LockTimeoutError):
+                QMessageBox.warning(self, "Error", f"Could not save {store}: file is locked by another user.")
+            elif error:
+                QMessageBox.critical(self, "Error", f"Failed to save {store} to file: {str(error)}")
+            elif result is not None and storage is self.storage:
+                merged, conflicts, signature, context = result
+                if context.get("link_settings"):
+                    self.adopt_migrated_link_settings(context["link_settings"])
+                self.saved_digests[store] = content_digest(merged)
+                if merged is not records and content_digest(getattr(self, store)) == digest:
+                    # Nothing was edited while saving, so take the merged records including other users' changes
+                    self.replace_store(store, copy.deepcopy(merged))
+                    self.patch_store_views(store)
+                if conflicts:
+                    print(f"Merged {store} with conflicting edits to: {', '.join(conflicts)}")
+                    if not wait:
+                        QMessageBox.information(self, "Merged Changes", f"Another user changed the same {store} while you were editing:\n\n"
+                                                + "\n".join(conflicts) + "\n\nYour version was kept, except for records you deleted that were edited elsewhere.")
+            self.update_dirty_indicator(store)
+        if wait:
+            on_written(*self.run_storage(store, write, wait=True))
         else:
-            self.guides = default_guides
-            self.save_guides()
+            self.run_storage(store, write, on_written)
 
     def save_links(self):
-        if self.acquire_lock(self.links_file):
-            try:
-                with open(self.links_file, 'w') as f:
-                    json.dump(self.links, f, indent=4)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save links to file: {str(e)}")
-            finally:
-                self.release_lock(self.links_file)
-        else:
-            QMessageBox.warning(self, "Error", "Could not save links: file is locked by another user.")
+        if "links" not in self.loading_stores:
+            self.prune_link_settings()  # Removed or renamed links leave their preferences behind
+        self.save_store("links")
 
     def save_commands(self):
-        if self.acquire_lock(self.commands_file):
-            try:
-                with open(self.commands_file, 'w') as f:
-                    json.dump(self.commands, f, indent=4)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save commands to file: {str(e)}")
-            finally:
-                self.release_lock(self.commands_file)
-        else:
-            QMessageBox.warning(self, "Error", "Could not save commands: file is locked by another user.")
+        self.save_store("commands")
 
     def save_guides(self):
-        if self.acquire_lock(self.guides_file):
-            try:
-                with open(self.guides_file, 'w') as f:
-                    json.dump(self.guides, f, indent=4)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save guides to file: {str(e)}")
-            finally:
-                self.release_lock(self.guides_file)
-        else:
-            QMessageBox.warning(self, "Error", "Could not save guides: file is locked by another user.")
+        self.save_store("guides")
+
+    def save_dirty_stores(self):
+        # Used on exit, so every write is waited for
+        for store in ("commands", "links", "guides"):
+            self.save_store(store, wait=True)
+        self.preferences_writer.cancel()
+        self.write_user_preferences(wait=True)
+        if self.usage_writer.cancel():
+            self.write_link_usage(wait=True)
+
+    def poll_store_signatures(self):
+        # Only Shared mode has other writers; one poll at a time so a slow share cannot pile them up
+        if self.settings.get("mode") != "Shared" or self.store_poll_running:
+            return
+        self.store_poll_running = True
+        storage = self.storage
+        directory = self.storage_directory()
+        help_file = self.get_file_path("powershell_help.json")
+        def read_signatures():
+            # A missing file is a legitimate signature; a missing share means we are offline
+            if not os.path.isdir(directory):
+                raise OSError(f"{directory} is not reachable")
+            signatures = {store: storage.signature(store) for store in STORE_FILENAMES}
+            signatures["help"] = file_signature(help_file)
+            return signatures
+        def on_signatures(signatures, error):
+            self.store_poll_running = False
+            if storage is not self.storage:
+                return
+            self.set_share_reachable(error is None, error)
+            if error:
+                return
+            self.share_synced_at = time.time()
+            for store, signature in signatures.items():
+                if store not in self.store_signatures:
+                    self.store_signatures[store] = signature  # First sighting, nothing to compare against
+                elif signature != self.store_signatures[store]:
+                    if store == "help":
+                        self.store_signatures["help"] = signature
+                        self.refresh_help_cache()
+                    else:
+                        self.reload_store(store)
+        self.run_in_background(read_signatures, on_signatures)
+
+    def set_share_reachable(self, reachable, error=None):
+        # Only transitions are reported, not every failed poll
+        if reachable == self.share_reachable:
+            return
+        self.share_reachable = reachable
+        if reachable:
+            print("Shared folder is reachable again")
+            self.statusBar().clearMessage()
+            return
+        synced = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.share_synced_at)) if self.share_synced_at else "an earlier session"
+        print(f"Shared folder unreachable: {str(error)}")
+        self.statusBar().setStyleSheet("color: #ffeb3b;")
+        self.statusBar().showMessage(f"Shared folder unreachable - showing the local copy from {synced}. Changes cannot be saved until it is back.")
+
+    def reload_store(self, store):
+        # Reload one store in the background and patch its views in place
+        if store in self.reloading_stores or store in self.loading_stores or self.is_store_dirty(store):
+            return  # Pending local edits are saved first; their write refreshes the signature
+        self.reloading_stores.add(store)
+        storage = self.storage
+        def on_read(data, error):
+            self.reloading_stores.discard(store)
+            if error or data is None or storage is not self.storage or self.is_store_dirty(store):
+                return
+            if content_digest(data) == self.saved_digests.get(store) and store not in self.unreadable_stores:
+                return  # Touched but not changed
+            self.apply_store(store, data, None)
+            self.patch_store_views(store)
+            print(f"Reloaded {store} after an external change")
+        self.read_store(store, on_read, report_errors=False)
+
+    def patch_store_views(self, store):
+        # Unbuilt tabs pick up the new data when they are first opened
+        if store == "links":
+            self.filter_links(self.search_query)
+        elif store == "commands" and self.commands_page.is_built():
+            self.refresh_commands_view()
+        elif store == "guides" and self.guides_page.is_built():
+            self.refresh_guides_view()
 
     def closeEvent(self, event):
-        self.save_commands()
-        self.save_links()
-        self.save_guides()
-        self.save_user_preferences()
+        self.store_poll_timer.stop()
+        self.save_dirty_stores()
+        try:
+            self.write_snapshot()
+        except OSError as e:
+            print(f"Failed to write startup snapshot: {str(e)}")
         event.accept()
 
+    def build_current_tab(self, index):
+        page = self.tabs.widget(index)
+        if isinstance(page, LazyTab):
+            page.ensure_built()
+
+    def invalidate_lazy_tabs(self):
+        # Rebuild only the tab being looked at; the others rebuild on their next activation
+        self.commands_page.reset()
+        self.guides_page.reset()
+        self.build_current_tab(self.tabs.currentIndex())
+
     def update_tab_styles(self, index):
         stylesheet = ""
         for i in range(self.tabs.count()):
@@ -1805,10 +3831,18 @@ class MainApp(QMainWindow):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        if self.tabs.currentIndex() == 0:
-            self.refresh_launchpad_tab()
+        # Only a change in the number of columns moves buttons, and then the pooled widgets are just re-positioned
+        if self.links_per_row() != self.links_columns:
+            self.filter_links(self.search_query)
+
+    def links_per_row(self):
+        available_width = self.width() - 10
+        button_width = 150
+        spacing = 5
+        return max(1, available_width // (button_width + spacing))
 
     def filter_links(self, query):
+        self.search_query = query
         # Find the grid widget in the current launchpad tab
         if not hasattr(self, 'launchpad_widget') or not self.launchpad_widget:
             self.refresh_launchpad_tab()
@@ -1818,123 +3852,156 @@ class MainApp(QMainWindow):
             self.refresh_launchpad_tab()
             return
 
-        # Clear existing grid
+        # Empty the grid; its widgets are pooled, so they are only taken out of the layout, not deleted
         search_widget = self.launchpad_widget.findChild(QLineEdit)
         if search_widget:
             search_widget.blockSignals(True)
         grid_layout = grid_widget.layout()
+        previously_placed = set()
         while grid_layout.count():
             item = grid_layout.takeAt(0)
             if item.widget():
-                item.widget().deleteLater()
+                previously_placed.add(item.widget())
+        placed = []
+
+        def place(widget, row, col, column_span=1):
+            grid_layout.addWidget(widget, row, col, 1, column_span)
+            placed.append(widget)
+
+        def finish_layout():
+            for widget in previously_placed.difference(placed):
+                widget.hide()
+            for widget in placed:
+                widget.show()  # Pooled widgets may have been hidden by an earlier pass
+            if search_widget:
+                search_widget.blockSignals(False)
+            grid_widget.update()  # Force UI refresh
+
+        # Links are still being read; on_store_loaded fills the grid when they arrive
+        if "links" in self.loading_stores:
+            place(self.links_loading_label, 0, 0)
+            self.link_tile_view.hide()
+            finish_layout()
+            return
 
         # Calculate grid layout
-        available_width = self.width() - 10
-        button_width = 150
-        spacing = 5
-        buttons_per_row = max(1, available_width // (button_width + spacing))
+        buttons_per_row = self.links_per_row()
+        self.links_columns = buttons_per_row
 
         # Filter and sort links using the local query parameter
-        filtered_links = [
-            link for link in self.links
-            if (query.lower() in link.get("name", "").lower() or
-                query.lower() in link.get("url", "").lower() or
-                query.lower() in link.get("tooltip", "").lower())
-        ]
-        # Split into favorites and non-favorites using user preferences
-        favorites = []
-        non_favorites = []
-        for link in filtered_links:
+        def is_favorite(link):
             link_key = self.get_link_settings_key(link["name"])
-            link_settings = self.user_preferences["link_settings"].get(link_key, {})
-            if link_settings.get("favorite", False):
-                favorites.append(link)
-            else:
-                non_favorites.append(link)
-        # Sort each group according to the selected sort order
-        if self.sort_order == "Alphabetical (A-Z)":
+            return self.user_preferences["link_settings"].get(link_key, {}).get("favorite", False)
+        # Fuzzy mode lays out the matches in score order, right after the action buttons, with no favorites section
+        ranked = self.user_preferences.get("fuzzy_search", False) and bool(tokenize(query))
+        if ranked:
+            favorites = self.search_indexes["links"].ranked_search(query, LINK_FIELD_WEIGHTS, lambda link: FAVORITE_BOOST if is_favorite(link) else 0, substring=True)
+            non_favorites = []
+        else:
+            # Every query token must match a word of the name, url or tooltip, by prefix or inside it ("desk" finds "Helpdesk")
+            matches = self.search_indexes["links"].search(query, substring=True)
+            filtered_links = self.links if matches is None else matches
+            # Split into favorites and non-favorites using user preferences
+            favorites = []
+            non_favorites = []
+            for link in filtered_links:
+                if is_favorite(link):
+                    favorites.append(link)
+                else:
+                    non_favorites.append(link)
+        # Sort each group according to the selected sort order (ranked results keep their score order)
+        if not ranked and self.sort_order == "Alphabetical (A-Z)":
             favorites.sort(key=lambda x: x["name"].lower())
             non_favorites.sort(key=lambda x: x["name"].lower())
-        elif self.sort_order == "Alphabetical (Z-A)":
+        elif not ranked and self.sort_order == "Alphabetical (Z-A)":
             favorites.sort(key=lambda x: x["name"].lower(), reverse=True)
             non_favorites.sort(key=lambda x: x["name"].lower(), reverse=True)
+        elif not ranked and self.sort_order in ("Most used", "Recently used"):
+            # Frecency and last launch are stored ready to compare; never-launched links go last, A-Z
+            slot = 0 if self.sort_order == "Most used" else 1
+            never_used = [-math.inf, -math.inf]
+            usage_key = lambda x: (-self.link_usage.get(self.get_link_settings_key(x["name"]), never_used)[slot], x["name"].lower())
+            favorites.sort(key=usage_key)
+            non_favorites.sort(key=usage_key)
+
+        def link_widget(link):
+            # A link keeps its button until the link record itself is replaced or removed
+            btn_widget = self.link_widget_pool.get(id(link))
+            if btn_widget is None or btn_widget.link is not link:
+                if btn_widget is not None:
+                    btn_widget.deleteLater()  # The id now belongs to a different record
+                btn_widget = LinkButtonWidget(
+                    link,
+                    self.launch_local_app if self.is_local_link(link["url"]) else self.open_website,
+                    self.edit_link,
+                    self
+                )
+                self.link_widget_pool[id(link)] = btn_widget
+            return btn_widget
 
         # Add action buttons (always in row 0)
-        add_link_btn = ActionButtonWidget("Add Link", self.add_new_link)
-        taka_helper_btn = ActionButtonWidget("Open Taka Helper", self.launch_taka_helper)
-        page_oncall_btn = ActionButtonWidget("Page OnCall", self.send_oncall_email, is_oncall=True)
-        buttons = [add_link_btn, taka_helper_btn, page_oncall_btn]
-
         row, col = 0, 0
-        for btn in buttons:
-            grid_layout.addWidget(btn, row, col)
+        for btn in self.action_buttons:
+            place(btn, row, col)
             col += 1
             if col >= buttons_per_row:
                 col = 0
                 row += 1
 
-        # Add favorited buttons (continue in row 0 until full)
-        for link in favorites:
-            local_extensions = ('.exe', '.txt', '.pdf', '.docx', '.xlsx', '.xlsm', '.bat', '.dotx', '.py')
-            url = link["url"].strip()
-            url_normalized = os.path.normpath(url).lower()
-            is_url = url_normalized.startswith(("http://", "https://"))
-            url_basename = os.path.basename(url_normalized)
-            is_local_file = not is_url and (any(url_basename.endswith(ext) for ext in local_extensions) or any(url_normalized.endswith(ext) for ext in local_extensions))
-
-            btn_widget = LinkButtonWidget(
-                link,
-                self.launch_local_app if is_local_file else self.open_website,
-                self.edit_link,
-                self
-            )
-            if col >= buttons_per_row:
-                col = 0
-                row += 1
-            grid_layout.addWidget(btn_widget, row, col)
-            col += 1
-
-        # Add a labeled delimiter between row 1 (action buttons + favorites) and row 2 (non-favorited buttons)
-        # Determine the row for the delimiter
-        delimiter_row = row
-        if col > 0:  # If the current row isn't empty, move to the next row for the delimiter
-            col = 0
-            delimiter_row += 1
-        # Create a labeled delimiter
-        delimiter = QLabel("Favorites Above | Regular Links Below")
-        delimiter.setStyleSheet("color: #ffeb3b; font-size: 12px; padding: 2px 0px 2px 0px; border-top: 1px solid #666; border-bottom: 1px solid #666; background-color: #2b2b2b;")
-        delimiter.setAlignment(Qt.AlignCenter)
-        delimiter.setFixedHeight(16)
-        grid_layout.addWidget(delimiter, delimiter_row, 0, 1, buttons_per_row)  # Span the entire row
-
-        # Force non-favorited buttons to start on the row after the delimiter
-        col = 0
-        row = delimiter_row + 1
-
-        # Add non-favorited buttons starting on the row after the delimiter
-        for link in non_favorites:
-            local_extensions = ('.exe', '.txt', '.pdf', '.docx', '.xlsx', '.xlsm', '.bat', '.dotx', '.py')
-            url = link["url"].strip()
-            url_normalized = os.path.normpath(url).lower()
-            is_url = url_normalized.startswith(("http://", "https://"))
-            url_basename = os.path.basename(url_normalized)
-            is_local_file = not is_url and (any(url_basename.endswith(ext) for ext in local_extensions) or any(url_normalized.endswith(ext) for ext in local_extensions))
-
-            btn_widget = LinkButtonWidget(
-                link,
-                self.launch_local_app if is_local_file else self.open_website,
-                self.edit_link,
-                self
-            )
-            if col >= buttons_per_row:
+        tile_view = self.user_preferences.get("tile_view", False)
+        if tile_view:
+            # The tile view paints the links itself; the grid keeps only the action buttons
+            self.link_tile_model.set_links(favorites, non_favorites, not ranked)
+        else:
+            # Add favorited buttons (continue in row 0 until full)
+            for link in favorites:
+                btn_widget = link_widget(link)
+                if col >= buttons_per_row:
+                    col = 0
+                    row += 1
+                place(btn_widget, row, col)
+                col += 1
+
+            if not ranked:
+                # Add a labeled delimiter between row 1 (action buttons + favorites) and row 2 (non-favorited buttons)
+                # Determine the row for the delimiter
+                delimiter_row = row
+                if col > 0:  # If the current row isn't empty, move to the next row for the delimiter
+                    col = 0
+                    delimiter_row += 1
+                place(self.links_delimiter, delimiter_row, 0, buttons_per_row)  # Span the entire row
+
+                # Force non-favorited buttons to start on the row after the delimiter
                 col = 0
-                row += 1
-            grid_layout.addWidget(btn_widget, row, col)
-            col += 1
+                row = delimiter_row + 1
+
+            # Add non-favorited buttons starting on the row after the delimiter
+            for link in non_favorites:
+                btn_widget = link_widget(link)
+                if col >= buttons_per_row:
+                    col = 0
+                    row += 1
+                place(btn_widget, row, col)
+                col += 1
+        self.link_tile_view.setVisible(tile_view)
+
+        finish_layout()
+        # Drop the buttons of links that were edited away or deleted, and all of them while the tile view is on
+        live_links = {} if tile_view else {id(link): link for link in self.links}
+        for key, btn_widget in list(self.link_widget_pool.items()):
+            if live_links.get(key) is not btn_widget.link:
+                del self.link_widget_pool[key]
+                btn_widget.deleteLater()
+
+    def set_fuzzy_search(self, enabled):
+        self.user_preferences["fuzzy_search"] = enabled
+        self.save_user_preferences()
+        self.filter_links(self.search_query)
 
-        if search_widget:
-            search_widget.blockSignals(False)
-        grid_widget.update()  # Force UI refresh
+    def set_tile_view(self, enabled):
+        self.user_preferences["tile_view"] = enabled
+        self.save_user_preferences()
+        self.filter_links(self.search_query)
 
     def sort_links(self, order):
         self.sort_order = order
@@ -1966,7 +4033,7 @@ class MainApp(QMainWindow):
         control_layout.addWidget(search)
 
         sort_combo = QComboBox()
-        sort_combo.addItems(["Sort", "Alphabetical (A-Z)", "Alphabetical (Z-A)"])
+        sort_combo.addItems(["Sort", "Alphabetical (A-Z)", "Alphabetical (Z-A)", "Most used", "Recently used"])
         sort_combo.setStyleSheet("""
             QComboBox {
                 background-color: #444;
@@ -1995,6 +4062,18 @@ class MainApp(QMainWindow):
             pass
         sort_combo.currentTextChanged.connect(self.sort_links)
         control_layout.addWidget(sort_combo)
+        fuzzy_check = QCheckBox("Fuzzy")
+        fuzzy_check.setToolTip("Tolerate typos and list the best matches first")
+        fuzzy_check.setStyleSheet("QCheckBox { color: white; font-size: 16px; }")
+        fuzzy_check.setChecked(self.user_preferences.get("fuzzy_search", False))
+        fuzzy_check.toggled.connect(self.set_fuzzy_search)
+        control_layout.addWidget(fuzzy_check)
+        tile_check = QCheckBox("Tiles")
+        tile_check.setToolTip("Paint links as tiles in a scrolling view; suited to libraries with thousands of links")
+        tile_check.setStyleSheet("QCheckBox { color: white; font-size: 16px; }")
+        tile_check.setChecked(self.user_preferences.get("tile_view", False))
+        tile_check.toggled.connect(self.set_tile_view)
+        control_layout.addWidget(tile_check)
         control_layout.addStretch()
         main_layout.addLayout(control_layout)
 
@@ -2005,6 +4084,22 @@ class MainApp(QMainWindow):
         grid_layout.setVerticalSpacing(5)
         grid_layout.setContentsMargins(2, 2, 2, 2)
         grid_widget.setLayout(grid_layout)
+        # Grid contents are created once per tab and reused by every filter_links pass
+        self.link_widget_pool = {}  # id(link) -> LinkButtonWidget for that link record
+        self.action_buttons = [
+            ActionButtonWidget("Add Link", self.add_new_link),
+            ActionButtonWidget("Open Taka Helper", self.launch_taka_helper),
+            ActionButtonWidget("Page OnCall", self.send_oncall_email, is_oncall=True)
+        ]
+        self.links_delimiter = QLabel("Favorites Above | Regular Links Below")
+        self.links_delimiter.setStyleSheet("color: #ffeb3b; font-size: 12px; padding: 2px 0px 2px 0px; border-top: 1px solid #666; border-bottom: 1px solid #666; background-color: #2b2b2b;")
+        self.links_delimiter.setAlignment(Qt.AlignCenter)
+        self.links_delimiter.setFixedHeight(16)
+        self.links_loading_label = QLabel("Loading links...")
+        self.links_loading_label.setStyleSheet("color: #aaa; font-size: 16px;")
+        self.link_tile_view = LinkTileView(self)
+        self.link_tile_model = self.link_tile_view.model()
+        self.link_tile_view.hide()
 
         container = QWidget()
         container_layout = QHBoxLayout()
@@ -2012,32 +4107,40 @@ class MainApp(QMainWindow):
         container_layout.addWidget(grid_widget)
         container.setLayout(container_layout)
         main_layout.addWidget(container)
+        main_layout.addWidget(self.link_tile_view, 1)  # Takes the free space from the spacer while shown
         main_layout.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding))
         widget.setLayout(main_layout)
 
         self.launchpad_widget = widget
-        # Explicitly call filter_links with an empty query to ensure favorites are positioned correctly
-        self.filter_links("")
+        # Explicitly call filter_links with the current query to ensure favorites are positioned correctly
+        self.filter_links(self.search_query)
         return widget
 
     def add_new_link(self):
+        if not self.check_store_loaded("links"):
+            return
         dialog = EditLinkDialog(self, is_new=True)
         if dialog.exec_():
             new_link = dialog.get_data()
             if new_link:
                 self.links.append(new_link)
+                self.index_add("links", new_link)
                 self.save_links()
-                self.refresh_launchpad_tab()
+                self.filter_links(self.search_query)
 
     def edit_link(self, link):
+        if not self.check_store_loaded("links"):
+            return
         dialog = EditLinkDialog(self, link, is_new=False)
         if dialog.exec_():
             new_link = dialog.get_data()
             if new_link is None:
                 self.links.remove(link)
+                self.index_remove("links", link)
             else:
                 index = self.links.index(link)
                 self.links[index] = new_link
+                self.index_replace("links", link, new_link)
             self.save_links()
             self.save_user_preferences()
             self.filter_links(self.search_query)
@@ -2058,9 +4161,13 @@ class MainApp(QMainWindow):
                 search_widget.textChanged.disconnect()
             except TypeError:
                 pass  # No connection to disconnect
+        # Block signals while swapping so the page that briefly becomes current is not built
+        self.tabs.blockSignals(True)
         self.tabs.removeTab(0)
+        self.launchpad_widget.deleteLater()  # Takes its pooled buttons with it
         self.launchpad_widget = self.launchpad_tab()
         self.tabs.insertTab(0, self.launchpad_widget, "Launchpad")
+        self.tabs.blockSignals(False)
         self.tabs.setCurrentIndex(0)
         # Restore search query without triggering signal
         search_widget = self.launchpad_widget.findChild(QLineEdit)
@@ -2114,21 +4221,77 @@ class MainApp(QMainWindow):
         dialog.exec_()
 
     def refresh_shared_files(self):
+        # Same in-place reload the watcher does, without waiting for the next poll
         if self.settings.get("mode") == "Shared":
-            self.load_links()
-            self.load_commands()
-            self.load_guides()
-            # Clear cmdlet_syntax_cache in NewCommandDialog instances
-            for dialog in QApplication.topLevelWidgets():
-                if isinstance(dialog, NewCommandDialog):
-                    dialog.cmdlet_syntax_cache.clear()
-                    dialog.help_repo = dialog.load_help_repository()
-            self.refresh_launchpad_tab()
-            self.tabs.removeTab(2)
-            self.tabs.insertTab(2, self.howto_guides_tab(), "How-To Guides")
-            self.tabs.removeTab(1)
-            self.tabs.insertTab(1, self.commands_tab(), "Commands")
-            QMessageBox.information(self, "Refresh", "Shared files reloaded.")
+            for store in STORE_FILENAMES:
+                self.reload_store(store)
+            self.refresh_help_cache()
+
+    def import_json_into_sqlite(self, confirm=True):
+        directory = self.storage_directory()
+        if confirm and QMessageBox.question(self, "Import JSON", f"Import the JSON files in {directory} into the SQLite database? Records with the same name are replaced.") != QMessageBox.Yes:
+            return
+        source, target = JsonStorageBackend(directory), SqliteStorageBackend(directory)
+        reload = self.storage.name == "SQLite"
+        if reload:
+            self.show_store_placeholders()
+        context = {}
+        def on_imported(copied, error):
+            if context.get("link_settings"):
+                self.adopt_migrated_link_settings(context["link_settings"])
+            if reload:
+                self.reload_stores()
+            if error:
+                QMessageBox.critical(self, "Error", f"Failed to import JSON files: {str(error)}")
+                return
+            QMessageBox.information(self, "Import JSON", "Imported " + (", ".join(f"{count} {store}" for store, count in copied.items()) or "nothing") + ".")
+        # Other clients may still be saving the JSON files, so their locks are held as well as the database's
+        files = [target.path] + [source.location(store) for store in STORE_FILENAMES]
+        self.run_locked_files(files, lambda: copy_stores(source, target, context), on_imported)
+
+    def export_sqlite_to_json(self):
+        directory = self.storage_directory()
+        source, target = SqliteStorageBackend(directory), JsonStorageBackend(directory)
+        if not os.path.exists(source.path):
+            QMessageBox.warning(self, "Export JSON", f"No SQLite database found in {directory}.")
+            return
+        if QMessageBox.question(self, "Export JSON", f"Overwrite the JSON files in {directory} with the contents of the SQLite database?") != QMessageBox.Yes:
+            return
+        reload = self.storage.name == "JSON"
+        if reload:
+            self.show_store_placeholders()
+        context = {}
+        def on_exported(copied, error):
+            if context.get("link_settings"):
+                self.adopt_migrated_link_settings(context["link_settings"])
+            if reload:
+                self.reload_stores()
+            if error:
+                QMessageBox.critical(self, "Error", f"Failed to export to JSON files: {str(error)}")
+                return
+            QMessageBox.information(self, "Export JSON", "Exported " + (", ".join(f"{count} {store}" for store, count in copied.items()) or "nothing") + ".")
+        files = [source.path] + [target.location(store) for store in STORE_FILENAMES]
+        self.run_locked_files(files, lambda: copy_stores(source, target, context), on_exported)
+
+    def reload_stores(self):
+        # Read in the background like at startup; the views show placeholders until each store arrives
+        self.load_stores_in_background(cached=False)
+        self.refresh_launchpad_tab()
+        self.invalidate_lazy_tabs()
+
+    def show_store_placeholders(self):
+        # Hold every store as loading, so nothing is edited or saved while its storage is being rewritten
+        for store in STORE_FILENAMES:
+            self.replace_store(store, [])
+            self.loading_stores.add(store)
+            self.store_loads.pop(store, None)
+        self.refresh_launchpad_tab()
+        self.invalidate_lazy_tabs()
+
+    def redetect_browsers(self):
+        browsers, _ = self.browser_service.redetect()
+        self.refresh_launchpad_tab()
+        QMessageBox.information(self, "Browsers", f"Detected browsers: {', '.join(browsers) if browsers else 'none'}")
 
     def launch_local_app(self, app_name, browser=None):
         try:
@@ -2146,8 +4309,9 @@ class MainApp(QMainWindow):
         try:
             if not url.startswith(("http://", "https://")):
                 url = f"https://{url}"
-            if browser and browser in self.browser_paths:
-                subprocess.Popen([self.browser_paths[browser], url], shell=False)
+            browsers, browser_paths = self.browser_service.get()
+            if browser and browser in browser_paths:
+                subprocess.Popen([browser_paths[browser], url], shell=False)
             else:
                 webbrowser.open(url)
         except Exception as e:
@@ -2160,17 +4324,17 @@ class MainApp(QMainWindow):
             if new_settings != self.settings:
                 self.settings = new_settings
                 self.save_settings()
-                self.commands_file = self.get_file_path("commands.json")
-                self.links_file = self.get_file_path("launchpad_links.json")
-                self.guides_file = self.get_file_path("howto_guides.json")
-                self.load_commands()
-                self.load_links()
-                self.load_guides()
-                self.refresh_launchpad_tab()
-                self.tabs.removeTab(2)
-                self.tabs.insertTab(2, self.howto_guides_tab(), "How-To Guides")
-                self.tabs.removeTab(1)
-                self.tabs.insertTab(1, self.commands_tab(), "Commands")
+                self.lock_manager.timeout = self.settings.get("lock_timeout", 10)
+                self.configure_storage()
+                import_json = False
+                if self.storage.name == "SQLite" and not any(self.storage.exists(store) for store in STORE_FILENAMES):
+                    json_storage = JsonStorageBackend(self.storage_directory())
+                    import_json = any(json_storage.exists(store) for store in STORE_FILENAMES) and QMessageBox.question(
+                        self, "SQLite Storage", "The SQLite database is empty. Import the existing JSON files into it?") == QMessageBox.Yes
+                if import_json:
+                    self.import_json_into_sqlite(confirm=False)  # Reloads the stores once the import is done
+                else:
+                    self.reload_stores()
                 self.tabs.setCurrentIndex(0)
 
     def get_all_aliases(self):
@@ -2190,57 +4354,127 @@ class MainApp(QMainWindow):
         if dialog.exec_():
             data = dialog.get_data()
             help_file = self.get_file_path("powershell_help.json")
-            if self.acquire_lock(help_file):
-                try:
-                    with open(help_file, 'r', encoding='utf-8-sig') as f:
-                        help_data = json.load(f)
-
-                    # Parse cmdlet and pipeline
-                    cmdlet = data["cmdlet"]
-                    parts = [part.strip() for part in cmdlet.split("|")]
-                    main_cmdlet = parts[0]
-                    pipeline_cmdlet = parts[1] if len(parts) > 1 else None
-
-                    # Initialize structure if not present
-                    if main_cmdlet not in help_data["cmdlets"]:
-                        help_data["cmdlets"][main_cmdlet] = {
-                            "aliases": [],
-                            "commands": [],
-                            "pipelines": {},
-                            "fullPipelines": []
-                        }
-
-                    # Save standalone or pipeline examples
-                    if pipeline_cmdlet:
-                        if pipeline_cmdlet not in help_data["cmdlets"][main_cmdlet]["pipelines"]:
-                            help_data["cmdlets"][main_cmdlet]["pipelines"][pipeline_cmdlet] = []
-                        help_data["cmdlets"][main_cmdlet]["pipelines"][pipeline_cmdlet].extend(data["examples"])
-                    else:
-                        help_data["cmdlets"][main_cmdlet]["commands"].extend(data["examples"])
-                        help_data["cmdlets"][main_cmdlet]["aliases"] = list(set(
-                            help_data["cmdlets"][main_cmdlet]["aliases"] + data["aliases"]
-                        ))
-
-                    # Save full pipeline example
-                    if data["full_pipeline"]:
-                        full_pipeline = data["full_pipeline"]
-                        if "fullPipelines" not in help_data["cmdlets"][main_cmdlet]:
-                            help_data["cmdlets"][main_cmdlet]["fullPipelines"] = []
-                        help_data["cmdlets"][main_cmdlet]["fullPipelines"].append(full_pipeline)
-
-                    # Write to file
-                    with open(help_file, 'w', encoding='utf-8') as f:
-                        json.dump(help_data, f, indent=4)
+            def add_example():
+                with open(help_file, 'r', encoding='utf-8-sig') as f:
+                    help_data = json.load(f)
+
+                # Parse cmdlet and pipeline
+                cmdlet = data["cmdlet"]
+                parts = [part.strip() for part in cmdlet.split("|")]
+                main_cmdlet = parts[0]
+                pipeline_cmdlet = parts[1] if len(parts) > 1 else None
+
+                # Initialize structure if not present
+                if main_cmdlet not in help_data["cmdlets"]:
+                    help_data["cmdlets"][main_cmdlet] = {
+                        "aliases": [],
+                        "commands": [],
+                        "pipelines": {},
+                        "fullPipelines": []
+                    }
 
+                # Save standalone or pipeline examples
+                if pipeline_cmdlet:
+                    if pipeline_cmdlet not in help_data["cmdlets"][main_cmdlet]["pipelines"]:
+                        help_data["cmdlets"][main_cmdlet]["pipelines"][pipeline_cmdlet] = []
+                    help_data["cmdlets"][main_cmdlet]["pipelines"][pipeline_cmdlet].extend(data["examples"])
+                else:
+                    help_data["cmdlets"][main_cmdlet]["commands"].extend(data["examples"])
+                    help_data["cmdlets"][main_cmdlet]["aliases"] = list(set(
+                        help_data["cmdlets"][main_cmdlet]["aliases"] + data["aliases"]
+                    ))
+
+                # Save full pipeline example
+                if data["full_pipeline"]:
+                    full_pipeline = data["full_pipeline"]
+                    if "fullPipelines" not in help_data["cmdlets"][main_cmdlet]:
+                        help_data["cmdlets"][main_cmdlet]["fullPipelines"] = []
+                    help_data["cmdlets"][main_cmdlet]["fullPipelines"].append(full_pipeline)
+
+                # Write to file
+                with open(help_file, 'w', encoding='utf-8') as f:
+                    json.dump(help_data, f, indent=4)
+
+                return cmdlet
+
+            def on_added(cmdlet, error):
+                if isinstance(error, LockTimeoutError):
+                    QMessageBox.warning(self, "Error", "Could not save: powershell_help.json is locked.")
+                elif error:
+                    QMessageBox.critical(self, "Error", f"Failed to save example: {str(error)}")
+                else:
                     QMessageBox.information(self, "Success", f"Added examples to {cmdlet}.")
+                    self.store_signatures["help"] = file_signature(help_file)
                     self.refresh_help_cache()
+            self.run_locked(help_file, add_example, on_added)
 
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to save example: {str(e)}")
-                finally:
-                    self.release_lock(help_file)
+    def import_records(self, store, parent):
+        """Stream an exported commands or guides file into the store; returns True if the store changed."""
+        if not self.check_store_loaded(store, parent):
+            return False
+        file_name, _ = QFileDialog.getOpenFileName(parent, f"Import {store.title()}", "", "JSON Files (*.json)")
+        if not file_name:
+            return False
+        normalize = normalize_command if store == "commands" else normalize_guide
+        progress = QProgressDialog(f"Reading {os.path.basename(file_name)}...", "Cancel", 0, max(1, os.path.getsize(file_name)), parent)
+        progress.setWindowTitle(f"Import {store.title()}")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(300)
+        imported, invalid, version = [], 0, 1
+        try:
+            for count, (record, bytes_read, version) in enumerate(iter_json_records(file_name), 1):
+                try:
+                    if not isinstance(record.get("title"), str):
+                        raise ValueError("missing title")
+                    imported.append(normalize(record))
+                except (AttributeError, KeyError, TypeError, ValueError):
+                    invalid += 1
+                if count % 200 == 0:
+                    progress.setValue(bytes_read)
+                    if progress.wasCanceled():
+                        return False
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(parent, "Error", f"Failed to import {store}: {str(e)}")
+            return False
+        finally:
+            progress.close()
+        if not imported:
+            QMessageBox.warning(parent, "No Records", f"No {store} were found in {os.path.basename(file_name)}.")
+            return False
+        upgrade_schema(store, imported, version)
+        # Picking individual records only makes sense for small files
+        if len(imported) <= IMPORT_SELECTION_LIMIT:
+            if store == "commands":
+                dialog = ImportCommandsDialog(imported, parent)
+                if not dialog.exec_():
+                    return False
+                imported = dialog.get_selected_commands()
             else:
-                QMessageBox.warning(self, "Error", "Could not save: powershell_help.json is locked.")
+                dialog = ImportGuidesDialog(imported, parent)
+                if not dialog.exec_():
+                    return False
+                imported = dialog.get_selected_guides()
+            if not imported:
+                QMessageBox.warning(parent, "No Selection", f"No {store} were selected to import.")
+                return False
+        records = getattr(self, store)
+        duplicates = find_duplicate_titles(records, imported)
+        strategy = "skip"
+        if duplicates:
+            dialog = ImportSummaryDialog(store, len(imported), duplicates, invalid, parent)
+            if not dialog.exec_():
+                return False
+            strategy = dialog.get_strategy()
+        added, replaced, skipped = merge_imported_records(records, imported, strategy, self.indexes_for(store))
+        message = f"Imported {added} new {store}."
+        if replaced:
+            message += f" Overwrote {replaced}."
+        if skipped:
+            message += f" Skipped {skipped} duplicates."
+        if invalid:
+            message += f" Ignored {invalid} invalid records."
+        QMessageBox.information(parent, "Success", message)
+        return bool(added or replaced)
 
     def refresh_help_cache(self):
             for dialog in QApplication.topLevelWidgets():
@@ -2421,33 +4655,9 @@ class MainApp(QMainWindow):
                     QMessageBox.critical(widget, "Error", f"Failed to export commands: {str(e)}")
 
         def import_commands():
-            file_name, _ = QFileDialog.getOpenFileName(widget, "Import Commands", "", "JSON Files (*.json)")
-            if file_name:
-                try:
-                    with open(file_name, 'r') as f:
-                        imported_commands = json.load(f)
-                    dialog = ImportCommandsDialog(imported_commands, widget)
-                    if dialog.exec_():
-                        selected_commands = dialog.get_selected_commands()
-                        if not selected_commands:
-                            QMessageBox.warning(widget, "No Selection", "No commands were selected to import.")
-                            return
-                        existing_titles = {command["title"] for command in self.commands}
-                        new_commands = []
-                        for command in selected_commands:
-                            if command["title"] not in existing_titles:
-                                if "pause_between_commands" not in command:
-                                    command["pause_between_commands"] = False
-                                new_commands.append(command)
-                                existing_titles.add(command["title"])
-                            else:
-                                QMessageBox.warning(widget, "Duplicate Command", f"Command '{command['title']}' already exists and was skipped.")
-                        self.commands.extend(new_commands)
-                        populate_commands(self.commands)
-                        self.save_commands()
-                        QMessageBox.information(widget, "Success", f"Imported {len(new_commands)} new commands successfully.")
-                except Exception as e:
-                    QMessageBox.critical(widget, "Error", f"Failed to import commands: {str(e)}")
+            if self.import_records("commands", widget):
+                filter_commands()
+                self.save_commands()
 
         def extract_commands(steps):
             recognized_commands = self.default_commands + self.custom_commands
@@ -2474,15 +4684,30 @@ class MainApp(QMainWindow):
                 self.command_list.addItem(item)
 
         def filter_commands():
-            query = search.text().lower()
-            filtered = [command for command in self.commands if query in command["title"].lower() or any(query in step["content"].lower() for step in command["steps"])]
+            # Every query token must match a word of the title or steps, by prefix or inside it, and switches like "/k" literally; title hits rank first
+            matches = self.search_indexes["commands"].ranked_search(search.text(), COMMAND_FIELD_WEIGHTS, fuzzy=False, substring=True)
             checked_titles = {self.command_list.item(i).text() for i in range(self.command_list.count()) if self.command_list.item(i).checkState() == Qt.Checked}
-            populate_commands(filtered)
+            populate_commands(self.commands if matches is None else matches)
             for i in range(self.command_list.count()):
                 item = self.command_list.item(i)
                 if item.text() in checked_titles:
                     item.setCheckState(Qt.Checked)
 
+        def refresh_commands_view():
+            # Re-run the current search over reloaded commands, keeping selection, checks and scroll position
+            selected_titles = {item.text() for item in self.command_list.selectedItems()}
+            scroll_value = self.command_list.verticalScrollBar().value()
+            self.command_list.blockSignals(True)
+            filter_commands()
+            for i in range(self.command_list.count()):
+                item = self.command_list.item(i)
+                if item.text() in selected_titles:
+                    item.setSelected(True)
+            self.command_list.blockSignals(False)
+            self.command_list.verticalScrollBar().setValue(scroll_value)
+            show_details()
+        self.refresh_commands_view = refresh_commands_view
+
         def show_details():
             if self.current_run_connection is not None:
                 try:
@@ -2503,11 +4728,11 @@ class MainApp(QMainWindow):
             item = selected_items[0]
             command = item.data(Qt.UserRole)
             commands = extract_commands(command["steps"])
-            desc_display = f"<b>{command['title']}</b><br><br>"
+            query_tokens = tokenize(search.text())  # Words matching the search are highlighted
+            desc_display = f"<b>{highlight_matches(command['title'], query_tokens)}</b><br><br>"
             for i, step in enumerate(command["steps"], 1):
-                content = step["content"]  # Raw content
                 step_type = "Command" if step["type"] == "command" else "Output"
-                content = content.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")  # Escape HTML
+                content = highlight_matches(step["content"], query_tokens)  # Escapes HTML
                 if step["type"] == "command":
                     content = f"<span style='color: #66b3ff;'>{content}</span>"
                 desc_display += f"{i}. {step_type}: {content}<br>"
@@ -2522,6 +4747,15 @@ class MainApp(QMainWindow):
                 self.current_run_connection = run_commands
                 self.run_button.clicked.connect(run_commands)
 
+        def run_command(command):
+            # Entry point for running a command from outside the list, e.g. the quick-launch palette
+            commands = extract_commands(command["steps"])
+            if not commands:
+                QMessageBox.warning(widget, "Nothing to Run", f"\"{command['title']}\" has no recognized commands to run.")
+                return
+            run_all_commands(commands, command)
+        self.run_command = run_command
+
         def run_all_commands(commands, command):
             shell = command.get("shell", "CMD")
             elevated = command.get("elevated", False)
@@ -2657,7 +4891,9 @@ class MainApp(QMainWindow):
             if dialog.exec_():
                 new_command = dialog.command
                 self.commands.append(new_command)
-                populate_commands(self.commands)
+                self.index_add("commands", new_command)
+                filter_commands()
+                self.save_commands()  # Command edits are flushed immediately, like links and guides
                 for i in range(self.command_list.count()):
                     item = self.command_list.item(i)
                     if item.text() == new_command["title"]:
@@ -2675,8 +4911,10 @@ class MainApp(QMainWindow):
             if dialog.exec_():
                 updated_command = dialog.command
                 command_index = self.commands.index(command)
+                self.index_replace("commands", self.commands[command_index], updated_command)  # Item data is a copy; the index tracks the stored record
                 self.commands[command_index] = updated_command
-                populate_commands(self.commands)
+                filter_commands()
+                self.save_commands()
                 for i in range(self.command_list.count()):
                     item = self.command_list.item(i)
                     if item.text() == updated_command["title"]:
@@ -2691,9 +4929,10 @@ class MainApp(QMainWindow):
                 return
             if QMessageBox.question(widget, "Confirm Delete", f"Are you sure you want to delete {len(checked_items)} command(s)?") == QMessageBox.Yes:
                 for item in checked_items:
-                    command = item.data(Qt.UserRole)
-                    self.commands.remove(command)
-                populate_commands(self.commands)
+                    command = self.commands.pop(self.commands.index(item.data(Qt.UserRole)))
+                    self.index_remove("commands", command)
+                filter_commands()
+                self.save_commands()
                 self.details_panel.setText("")
                 self.run_button.setEnabled(False)
                 self.edit_button.setEnabled(False)
@@ -2870,64 +5109,57 @@ class MainApp(QMainWindow):
                     QMessageBox.critical(widget, "Error", f"Failed to export guides: {str(e)}")
 
         def import_guides():
-            file_name, _ = QFileDialog.getOpenFileName(widget, "Import Guides", "", "JSON Files (*.json)")
-            if file_name:
-                try:
-                    with open(file_name, 'r') as f:
-                        imported_guides = json.load(f)
-                    for guide in imported_guides:
-                        if isinstance(guide["steps"], list):
-                            guide["steps"] = '<ol style="font-size: 16px;">' + "".join(f"<li>{step}</li>" for step in guide["steps"]) + "</ol>"
-                        if not guide["description"].startswith("<"):
-                            guide["description"] = f'<p style="font-size: 16px;">{guide["description"]}</p>'
-                    dialog = ImportGuidesDialog(imported_guides, widget)
-                    if dialog.exec_():
-                        selected_guides = dialog.get_selected_guides()
-                        if not selected_guides:
-                            QMessageBox.warning(widget, "No Selection", "No guides were selected to import.")
-                            return
-                        existing_titles = {guide["title"] for guide in self.guides}
-                        new_guides = []
-                        for guide in selected_guides:
-                            if guide["title"] not in existing_titles:
-                                new_guides.append(guide)
-                                existing_titles.add(guide["title"])
-                            else:
-                                QMessageBox.warning(widget, "Duplicate Guide", f"Guide '{guide['title']}' already exists and was skipped.")
-                        self.guides.extend(new_guides)
-                        populate_guides(self.guides)
-                        self.save_guides()
-                        QMessageBox.information(widget, "Success", f"Imported {len(new_guides)} new guides successfully.")
-                except Exception as e:
-                    QMessageBox.critical(widget, "Error", f"Failed to import guides: {str(e)}")
+            if self.import_records("guides", widget):
+                filter_guides()
+                self.save_guides()
 
-        def populate_guides(guides_to_show):
+        def populate_guides(guides_to_show, snippets=None):
             self.guide_list.clear()
             for guide in guides_to_show:
                 item = QListWidgetItem(guide["title"])
                 item.setData(Qt.UserRole, guide)
+                if snippets and snippets.get(id(guide)):
+                    item.setToolTip(snippets[id(guide)])
                 item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
                 item.setCheckState(Qt.Unchecked)
                 item.setTextAlignment(Qt.AlignLeft)
                 self.guide_list.addItem(item)
 
         def filter_guides():
-            query = search.text().lower()
-            filtered = []
-            for guide in self.guides:
-                if query in guide["title"].lower() or query in guide["description"].lower():
-                    filtered.append(guide)
-                    continue
-                steps_text = re.sub(r'<[^>]+>', '', guide["steps"]).lower()
-                if query in steps_text:
-                    filtered.append(guide)
+            # Ranked over the plain text of titles, descriptions and steps, so markup like "font-size" never matches
+            index = self.search_indexes["guides"]
+            matches = index.ranked_search(search.text(), GUIDE_FIELD_WEIGHTS, fuzzy=False, substring=True)
+            snippets = {}
+            if matches is not None:
+                # Tooltip excerpt from the description or steps around the first matching word
+                query_tokens = tokenize(search.text())
+                for guide in matches:
+                    fields = index.fields_of(guide)
+                    snippet = match_snippet(fields["description"], query_tokens) or match_snippet(fields["steps"], query_tokens)
+                    if snippet:
+                        snippets[id(guide)] = f"<qt>{highlight_matches(snippet, query_tokens)}</qt>"
             checked_titles = {self.guide_list.item(i).text() for i in range(self.guide_list.count()) if self.guide_list.item(i).checkState() == Qt.Checked}
-            populate_guides(filtered)
+            populate_guides(self.guides if matches is None else matches, snippets)
             for i in range(self.guide_list.count()):
                 item = self.guide_list.item(i)
                 if item.text() in checked_titles:
                     item.setCheckState(Qt.Checked)
 
+        def refresh_guides_view():
+            # Re-run the current search over reloaded guides, keeping selection, checks and scroll position
+            selected_titles = {item.text() for item in self.guide_list.selectedItems()}
+            scroll_value = self.guide_list.verticalScrollBar().value()
+            self.guide_list.blockSignals(True)
+            filter_guides()
+            for i in range(self.guide_list.count()):
+                item = self.guide_list.item(i)
+                if item.text() in selected_titles:
+                    item.setSelected(True)
+            self.guide_list.blockSignals(False)
+            self.guide_list.verticalScrollBar().setValue(scroll_value)
+            show_guide_details()
+        self.refresh_guides_view = refresh_guides_view
+
         def make_urls_clickable(text):
             text = re.sub(r'<!DOCTYPE[^>]*>', '', text, flags=re.IGNORECASE)
             url_pattern = r'(?<!href=")(https?://[^\s<"]+|www\.[^\s<"]+)'
@@ -2958,12 +5190,25 @@ class MainApp(QMainWindow):
             self.guide_edit_button.setEnabled(len(selected_items) == 1)
             self.guide_delete_button.setEnabled(True)
 
+        def select_guide(guide):
+            # Show a guide picked outside the list, e.g. from the quick-launch palette
+            search.clear()
+            for i in range(self.guide_list.count()):
+                item = self.guide_list.item(i)
+                if item.data(Qt.UserRole) == guide:
+                    self.guide_list.clearSelection()
+                    self.guide_list.setCurrentItem(item)
+                    self.guide_list.scrollToItem(item)
+                    break
+        self.select_guide = select_guide
+
         def add_new_guide():
             dialog = NewGuideDialog(widget)
             if dialog.exec_():
                 new_guide = dialog.guide_data
                 self.guides.append(new_guide)
-                populate_guides(self.guides)
+                self.index_add("guides", new_guide)
+                filter_guides()
                 self.save_guides()
                 for i in range(self.guide_list.count()):
                     item = self.guide_list.item(i)
@@ -2982,8 +5227,9 @@ class MainApp(QMainWindow):
             if dialog.exec_():
                 updated_guide = dialog.guide_data
                 guide_index = self.guides.index(guide)
+                self.index_replace("guides", self.guides[guide_index], updated_guide)  # Item data is a copy; the index tracks the stored record
                 self.guides[guide_index] = updated_guide
-                populate_guides(self.guides)
+                filter_guides()
                 self.save_guides()
                 for i in range(self.guide_list.count()):
                     item = self.guide_list.item(i)
@@ -2998,9 +5244,9 @@ class MainApp(QMainWindow):
                 return
             if QMessageBox.question(widget, "Confirm Delete", f"Are you sure you want to delete {len(selected_items)} guide(s)?") == QMessageBox.Yes:
                 for item in selected_items:
-                    guide = item.data(Qt.UserRole)
-                    self.guides.remove(guide)
-                populate_guides(self.guides)
+                    guide = self.guides.pop(self.guides.index(item.data(Qt.UserRole)))
+                    self.index_remove("guides", guide)
+                filter_guides()
                 self.save_guides()
                 self.guide_details_panel.setHtml("")
                 self.guide_edit_button.setEnabled(False)
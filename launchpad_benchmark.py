@@ -0,0 +1,204 @@
+"""
+Headless startup benchmark for LaunchPad.
+
+Generates synthetic launchpad_links.json, commands.json, howto_guides.json and
+powershell_help.json libraries in a throwaway app-data dir, starts MainApp on the
+offscreen Qt platform and reports per-phase timings as JSON. A micro-benchmark also
+times each keystroke of a links search over --search-size links (index, fuzzy ranked
+index and full scan) and of the quick-launch palette over as many mixed items.
+
+Usage: python launchpad_benchmark.py --sizes 10,1000,10000 --repeat 3 --output results.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")  # Must be set before QApplication exists
+
+from PyQt5.QtCore import QEventLoop
+from PyQt5.QtWidgets import QApplication
+
+import launchpad
+
+def make_links(size):
+    links = []
+    for i in range(size):
+        if i % 10 == 0:
+            url, tooltip = f"tool{i}.exe", f"Launch local tool {i}"
+        else:
+            url, tooltip = f"https://host{i}.example.com/portal/{i}", f"Open portal {i}"
+        links.append({"name": f"Link {i:05d}", "url": url, "tooltip": tooltip, "icon": "icon-default.png"})
+    return links
+
+def make_commands(size):
+    return [{
+        "title": f"Command {i:05d}",
+        "steps": [
+            {"type": "command", "content": f"ping host{i}.example.com", "delay": 500},
+            {"type": "output", "content": f"Checked host {i}", "delay": 0}
+        ],
+        "shell": "CMD",
+        "elevated": False,
+        "pause_between_commands": False
+    } for i in range(size)]
+
+def make_guides(size):
+    return [{
+        "title": f"Guide {i:05d}",
+        "description": f'<p style="font-size: 16px;">How to configure system {i}.</p>',
+        "steps": '<ol style="font-size: 16px;">' + "".join(f"<li>Step {n} for system {i}</li>" for n in range(5)) + "</ol>"
+    } for i in range(size)]
+
+def make_help(size):
+    return {"cmdlets": {
+        f"Get-Thing{i}": {
+            "aliases": [f"gt{i}"],
+            "commands": [f"Get-Thing{i} -Name example"],
+            "pipelines": {},
+            "fullPipelines": []
+        } for i in range(size)
+    }}
+
+def write_library(app_data_dir, size):
+    os.makedirs(app_data_dir, exist_ok=True)
+    files = {
+        "settings.json": {"mode": "Local", "network_path": "", "oncall_email": "oncall@example.com"},
+        "powershell_help.json": make_help(size)
+    }
+    for filename, data in files.items():
+        with open(os.path.join(app_data_dir, filename), 'w') as f:
+            json.dump(data, f, indent=4)
+    # Stores go through the backend so they carry the current schema version and loading measures plain reads, not the one-time upgrade
+    storage = launchpad.JsonStorageBackend(app_data_dir)
+    for store, records in (("links", make_links(size)), ("commands", make_commands(size)), ("guides", make_guides(size))):
+        storage.write(store, records)
+    # A fresh vocabulary cache keeps the shell probe out of the measurement
+    launchpad.save_command_vocabulary(os.path.join(app_data_dir, "command_vocabulary.json"), [])
+
+def timed(timings, phase, func):
+    start = time.perf_counter()
+    result = func()
+    timings[phase] = time.perf_counter() - start
+    return result
+
+def scan_links(links, query):
+    # The full scan filter_links did before the search index
+    query = query.lower()
+    return [link for link in links if query in link["name"].lower() or query in link["url"].lower() or query in link["tooltip"].lower()]
+
+def best_of(func, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def bench_link_search(size, query="portal 12"):
+    """Per-keystroke cost of typing query into the links search: the index versus the old full scan."""
+    links = make_links(size)
+    index = launchpad.SearchIndex(launchpad.link_search_fields)
+    build_seconds, _ = best_of(lambda: index.rebuild(links), repeat=1)
+    keystrokes = []
+    for length in range(1, len(query) + 1):
+        typed = query[:length]
+        index_seconds, matches = best_of(lambda: index.search(typed, substring=True))
+        fuzzy_seconds, fuzzy_matches = best_of(lambda: index.ranked_search(typed, launchpad.LINK_FIELD_WEIGHTS, substring=True))
+        scan_seconds, _ = best_of(lambda: scan_links(links, typed))
+        keystrokes.append({
+            "query": typed,
+            "matches": size if matches is None else len(matches),
+            "fuzzy_matches": size if fuzzy_matches is None else len(fuzzy_matches),
+            "index_ms": index_seconds * 1000,
+            "fuzzy_ms": fuzzy_seconds * 1000,
+            "scan_ms": scan_seconds * 1000
+        })
+    return {"size": size, "build_ms": build_seconds * 1000, "keystrokes": keystrokes}
+
+def bench_palette_search(size, query="system 12"):
+    """Per-keystroke cost of the quick-launch palette over size items split evenly across links, commands and guides."""
+    records = make_links(size // 3) + make_commands(size // 3) + make_guides(size - 2 * (size // 3))
+    index = launchpad.SearchIndex(launchpad.palette_search_fields)
+    build_seconds, _ = best_of(lambda: index.rebuild(records), repeat=1)
+    keystrokes = []
+    for length in range(1, len(query) + 1):
+        typed = query[:length]
+        seconds, matches = best_of(lambda: index.ranked_search(typed, launchpad.PALETTE_FIELD_WEIGHTS, limit=launchpad.PALETTE_MAX_RESULTS))
+        keystrokes.append({"query": typed, "matches": len(matches or []), "palette_ms": seconds * 1000})
+    return {"size": size, "build_ms": build_seconds * 1000, "keystrokes": keystrokes}
+
+def wait_for_stores(app, window):
+    while window.loading_stores:
+        app.processEvents(QEventLoop.AllEvents, 50)
+
+def run_once(app, size):
+    with tempfile.TemporaryDirectory(prefix="launchpad-bench-") as local_app_data:
+        os.environ["LOCALAPPDATA"] = local_app_data
+        write_library(os.path.join(local_app_data, "LaunchPad"), size)
+        timings = {}
+        window = timed(timings, "total_init", launchpad.MainApp)
+        # Stores load in the background; measure until the last one has been applied
+        timed(timings, "stores_loaded", lambda: wait_for_stores(app, window))
+        timings.update(window.startup_timings)
+        timed(timings, "commands_tab", window.commands_page.ensure_built)
+        timed(timings, "howto_guides_tab", window.guides_page.ensure_built)
+        timed(timings, "filter_links_query", lambda: window.filter_links("portal 1"))
+        window.user_preferences["tile_view"] = True
+        timed(timings, "filter_links_tiles", lambda: window.filter_links("portal 1"))
+        window.user_preferences["tile_view"] = False
+        timed(timings, "close", window.close)
+        window.deleteLater()
+        app.processEvents()
+        # A second start picks up the startup snapshot written by close
+        window = timed(timings, "snapshot_init", launchpad.MainApp)
+        timed(timings, "snapshot_stores_loaded", lambda: wait_for_stores(app, window))
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+        return timings
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure LaunchPad startup against synthetic libraries.")
+    parser.add_argument("--sizes", default="10,1000,10000", help="Comma-separated record counts per store")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per size")
+    parser.add_argument("--search-size", type=int, default=10000, help="Links in the search micro-benchmark (0 to skip)")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    results = []
+    for size in [int(size) for size in args.sizes.split(",") if size.strip()]:
+        for run in range(args.repeat):
+            timings = run_once(app, size)
+            results.append({"size": size, "run": run, "timings": timings})
+            print(f"size={size} run={run} " + " ".join(f"{phase}={seconds * 1000:.1f}ms" for phase, seconds in timings.items()), file=sys.stderr)
+
+    report = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results
+    }
+    if args.search_size:
+        report["link_search"] = bench_link_search(args.search_size)
+        for keystroke in report["link_search"]["keystrokes"]:
+            print(f"search size={args.search_size} query={keystroke['query']!r} matches={keystroke['matches']} "
+                  f"index={keystroke['index_ms']:.2f}ms fuzzy={keystroke['fuzzy_ms']:.2f}ms scan={keystroke['scan_ms']:.2f}ms", file=sys.stderr)
+        report["palette_search"] = bench_palette_search(args.search_size)
+        for keystroke in report["palette_search"]["keystrokes"]:
+            print(f"palette size={args.search_size} query={keystroke['query']!r} matches={keystroke['matches']} "
+                  f"palette={keystroke['palette_ms']:.2f}ms", file=sys.stderr)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=4)
+    else:
+        json.dump(report, sys.stdout, indent=4)
+        print()
+
+if __name__ == "__main__":
+    main()
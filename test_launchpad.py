@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+# launchpad is a Windows PyQt5 application; these checks cover its Qt-free helpers
+pytest.importorskip("winreg")
+pytest.importorskip("psutil")
+pytest.importorskip("PyQt5")
+
+import launchpad
+
+
+def link_index(links):
+    index = launchpad.SearchIndex(launchpad.link_search_fields)
+    index.rebuild(links)
+    return index
+
+
+def test_link_search_matches_inside_words():
+    index = link_index(launchpad.DEFAULT_LINKS)
+    assert [link["name"] for link in index.search("desk", substring=True)] == ["Helpdesk"]
+    assert [link["name"] for link in index.ranked_search("desk", launchpad.LINK_FIELD_WEIGHTS, substring=True)] == ["Helpdesk"]
+    assert [link["name"] for link in index.search("365", substring=True)] == ["OWA"]
+
+
+def test_copy_stores_keeps_version_1_link_settings(tmp_path):
+    # A links file from before schema versions: a plain array with colors and favorites in the records
+    links = [{"name": "Wiki", "url": "https://wiki.example.com", "tooltip": "", "icon": "", "color": "#ff0000", "favorite": True}]
+    (tmp_path / "launchpad_links.json").write_text(json.dumps(links))
+    source = launchpad.JsonStorageBackend(str(tmp_path))
+    target = launchpad.SqliteStorageBackend(str(tmp_path))
+    context = {}
+    assert launchpad.copy_stores(source, target, context) == {"links": 1}
+    assert context["link_settings"] == {"Wiki": {"color": "#ff0000", "favorite": True}}
+    records, version = target.read("links")
+    assert version == launchpad.SCHEMA_VERSION
+    assert records == [{"name": "Wiki", "url": "https://wiki.example.com", "tooltip": "", "icon": ""}]
+    # And back again: the exported file is read at the current version, with nothing left to migrate
+    context = {}
+    launchpad.copy_stores(target, source, context)
+    assert source.read("links") == (records, launchpad.SCHEMA_VERSION)
+    assert context == {}